@@ -35,10 +35,9 @@ like applying modifiers and merging objects in a non-destructive way.",
     "category": "Import-Export",
 }
 
-auto_load.init()
-
 
 def register() -> None:
+    auto_load.init()
     auto_load.register()
 
 
@@ -0,0 +1,38 @@
+import bpy
+
+
+class ArmatureCache:
+    """
+    Armature lookups shared by the stages of one export or validation.
+
+    Entries are keyed by object, so objects must not be removed or have their
+    Armature modifiers changed while the cache is in use.
+    """
+
+    def __init__(self) -> None:
+        self.armatures = {}  # key: object, value: armature object or None
+        self.deform_bone_names = {}  # key: armature object, value: frozenset
+
+    def get_armature(self, obj: bpy.types.Object) -> bpy.types.Object | None:
+        if obj not in self.armatures:
+            self.armatures[obj] = obj.find_armature()
+        return self.armatures[obj]
+
+    def get_deform_bone_names(self, obj: bpy.types.Object) -> frozenset:
+        """Return names of the deform bones of the armature deforming the object."""
+        armature = self.get_armature(obj)
+        if armature is None:
+            return frozenset()
+        if armature not in self.deform_bone_names:
+            self.deform_bone_names[armature] = frozenset(
+                bone.name for bone in armature.data.bones if bone.use_deform
+            )
+        return self.deform_bone_names[armature]
+
+    def get_deform_group_indices(self, obj: bpy.types.Object) -> set:
+        deform_bone_names = self.get_deform_bone_names(obj)
+        return {
+            vertex_group.index
+            for vertex_group in obj.vertex_groups
+            if vertex_group.name in deform_bone_names
+        }
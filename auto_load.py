@@ -1,5 +1,6 @@
 import importlib
 import inspect
+import json
 import pkgutil
 import typing
 from pathlib import Path
@@ -17,13 +18,28 @@ blender_version = bpy.app.version
 modules = None
 ordered_classes = None
 
+# Registration order cached across Blender sessions
+cache_path = Path(__file__).parent / "__pycache__" / "auto_load_cache.json"
+
 
 def init() -> None:
     global modules  # noqa: PLW0603
     global ordered_classes  # noqa: PLW0603
 
-    modules = get_all_submodules(Path(__file__).parent)
+    directory = Path(__file__).parent
+    signature = get_source_signature(directory)
+
+    cached = load_cached_classes(directory.name, signature)
+    if cached is not None:
+        modules, ordered_classes = cached
+        return
+
+    modules = get_all_submodules(directory)
     ordered_classes = get_ordered_classes_to_register(modules)
+    save_cached_classes(signature, modules, ordered_classes)
+
+    # Modules not needed for registration are imported on demand
+    modules = get_registration_modules(modules, ordered_classes)
 
 
 def register() -> None:
@@ -71,6 +87,85 @@ def iter_submodule_names(path, root=""):  # noqa: ANN202, ANN001
             yield root + module_name
 
 
+# Cache registration order
+#################################################
+
+
+def get_source_signature(directory: Path) -> list:
+    return [
+        list(blender_version),
+        *(
+            [str(path.relative_to(directory)), stat.st_mtime_ns, stat.st_size]
+            for path, stat in sorted(
+                (path, path.stat()) for path in directory.rglob("*.py")
+            )
+        ),
+    ]
+
+
+def get_registration_modules(modules, ordered_classes):  # noqa: ANN202, ANN001
+    class_modules = {cls.__module__ for cls in ordered_classes}
+    return [
+        module
+        for module in modules
+        if module.__name__ == __name__
+        or module.__name__ in class_modules
+        or hasattr(module, "register")
+        or hasattr(module, "unregister")
+    ]
+
+
+def get_relative_name(name: str) -> str:
+    return name.removeprefix(__package__ + ".")
+
+
+def load_cached_classes(package_name: str, signature: list) -> tuple | None:
+    try:
+        with cache_path.open(encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cache.get("signature") != signature:
+        return None
+
+    try:
+        cached_modules = [
+            importlib.import_module("." + name, package_name)
+            for name in cache["modules"]
+        ]
+        module_dict = {
+            get_relative_name(module.__name__): module for module in cached_modules
+        }
+        cached_classes = [
+            getattr(module_dict[module_name], class_name)
+            for module_name, class_name in cache["classes"]
+        ]
+    except (ImportError, KeyError, AttributeError):
+        return None
+
+    return cached_modules, cached_classes
+
+
+def save_cached_classes(signature: list, modules, ordered_classes) -> None:  # noqa: ANN001
+    registration_modules = get_registration_modules(modules, ordered_classes)
+    cache = {
+        "signature": signature,
+        "modules": [
+            get_relative_name(module.__name__) for module in registration_modules
+        ],
+        "classes": [
+            [get_relative_name(cls.__module__), cls.__name__] for cls in ordered_classes
+        ],
+    }
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with cache_path.open("w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # Read-only add-on directory
+
+
 # Find classes to register
 #################################################
 
@@ -0,0 +1,113 @@
+"""
+Output backends of the export pipeline.
+
+All backends write the same preprocessed scene, so several formats are
+exported from one pass of apply, merge and shapekey processing.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import bpy
+
+from .core import call_operator
+
+
+class ExportBackend(ABC):
+    name = ""
+    label = ""  # Format name shown to the user
+    extension = ""
+    # The exporter appends its extension to paths without it
+    forces_extension = False
+
+    def get_output_path(self, export_path: str) -> str:
+        return str(Path(export_path).with_suffix(self.extension))
+
+    @abstractmethod
+    def get_settings(self, export_settings: bpy.types.AnyType) -> bpy.types.AnyType:
+        pass
+
+    @abstractmethod
+    def write(
+        self,
+        export_settings: bpy.types.AnyType,
+        filepath: str,
+        **overrides: bpy.types.AnyType,
+    ) -> None:
+        """
+        Write the file.
+
+        Parameters:
+        - export_settings (bpy.types.AnyType): Export settings
+        - filepath (str): Output file path.
+        - overrides: Operator properties replacing the settings. (e.g. use_selection)
+        """
+
+    def get_operator_kwargs(self, export_settings: bpy.types.AnyType) -> dict:
+        settings = self.get_settings(export_settings)
+        return {key: getattr(settings, key, None) for key in settings.__annotations__}
+
+
+class FbxBackend(ExportBackend):
+    name = "FBX"
+    label = "FBX"
+    extension = ".fbx"
+
+    def get_output_path(self, export_path: str) -> str:
+        # The export path is the FBX path
+        return export_path
+
+    def get_settings(self, export_settings: bpy.types.AnyType) -> bpy.types.AnyType:
+        return export_settings.fbx_export_settings
+
+    def write(
+        self,
+        export_settings: bpy.types.AnyType,
+        filepath: str,
+        **overrides: bpy.types.AnyType,
+    ) -> None:
+        call_operator(
+            bpy.ops.export_scene.fbx,
+            filepath=filepath,
+            **{**self.get_operator_kwargs(export_settings), **overrides},
+        )
+
+
+class GltfBackend(ExportBackend):
+    name = "GLTF"
+    label = "GLB"
+    extension = ".glb"
+    forces_extension = True
+
+    def get_settings(self, export_settings: bpy.types.AnyType) -> bpy.types.AnyType:
+        return export_settings.gltf_export_settings
+
+    def write(
+        self,
+        export_settings: bpy.types.AnyType,
+        filepath: str,
+        **overrides: bpy.types.AnyType,
+    ) -> None:
+        call_operator(
+            bpy.ops.export_scene.gltf,
+            filepath=filepath,
+            **{**self.get_operator_kwargs(export_settings), **overrides},
+        )
+
+
+# key: export_formats item, value: backend
+export_backends = {backend.name: backend for backend in (FbxBackend(), GltfBackend())}
+
+
+def get_export_backends(export_settings: bpy.types.AnyType) -> list:
+    """Return the backends of the enabled export formats in a fixed order."""
+    return [
+        backend
+        for name, backend in export_backends.items()
+        if name in export_settings.export_formats
+    ]
+
+
+def get_export_format_label(export_settings: bpy.types.AnyType) -> str:
+    """Return the enabled export formats for messages. (e.g. "FBX, GLB")"""
+    return ", ".join(backend.label for backend in get_export_backends(export_settings))
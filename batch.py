@@ -0,0 +1,298 @@
+"""
+Batch driver to export many blend files with background Blender processes.
+
+This script runs with a plain Python interpreter and does not import bpy.
+
+Usage:
+    python batch.py manifest.json --blender /path/to/blender [--jobs 4]
+        [--memory-budget 16] [--memory-per-job 2] [--retries 1]
+        [--timeout 600] [--summary summary.json]
+
+The manifest is a JSON list of jobs. Relative paths are resolved from the
+manifest directory. "settings" is passed to headless.py as the job settings.
+    [
+        {"blend": "chara/a.blend", "output": "export/a.fbx"},
+        {"blend": "chara/b.blend", "output": "export/b.fbx", "settings": {}}
+    ]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+HEADLESS_SCRIPT = Path(__file__).resolve().parent / "headless.py"
+
+# Keep the end of stderr in the summary
+ERROR_TAIL_LENGTH = 2000
+
+
+@dataclass
+class BatchJob:
+    blend: str
+    output: str
+    settings: dict = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    blend: str
+    output: str
+    status: str = "failed"
+    attempts: int = 0
+    elapsed: float = 0.0
+    returncode: int | None = None
+    validation: list = field(default_factory=list)
+    error: str = ""
+
+
+def load_manifest(path: Path) -> list:
+    """
+    Load batch jobs from the manifest file.
+
+    Parameters:
+    - path (Path): Manifest JSON file.
+
+    Returns:
+    - list: BatchJob list with absolute paths.
+    """
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    base_dir = path.resolve().parent
+    return [
+        BatchJob(
+            blend=str(base_dir / entry["blend"]),
+            output=str(base_dir / entry["output"]),
+            settings=entry.get("settings", {}),
+        )
+        for entry in entries
+    ]
+
+
+def get_total_memory() -> float | None:
+    """Return the physical memory size in GB, or None if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1024**3
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_job_count(
+    requested: int | None,
+    memory_budget: float | None,
+    memory_per_job: float,
+) -> int:
+    """
+    Decide the number of concurrent Blender processes.
+
+    Parameters:
+    - requested (int | None): Number of jobs set by the user.
+    - memory_budget (float | None): Memory available to the batch in GB.
+    - memory_per_job (float): Expected peak memory of one process in GB.
+
+    Returns:
+    - int: Number of concurrent processes. (at least 1)
+    """
+    if requested is not None:
+        return max(1, requested)
+
+    job_count = os.cpu_count() or 1
+    if memory_budget is None:
+        memory_budget = get_total_memory()
+    if memory_budget is not None and memory_per_job > 0:
+        job_count = min(job_count, int(memory_budget // memory_per_job))
+    return max(1, job_count)
+
+
+def run_attempt(
+    blender: str,
+    job: BatchJob,
+    temp_dir: Path,
+    timeout: float | None,
+) -> tuple:
+    """
+    Run one export process.
+
+    Returns:
+    - tuple: (returncode, report dict, stderr)
+    """
+    job_path = temp_dir / "job.json"
+    report_path = temp_dir / "report.json"
+    job_path.write_text(json.dumps({"settings": job.settings}), encoding="utf-8")
+    report_path.unlink(missing_ok=True)
+
+    blender_args = [
+        blender,
+        "--factory-startup",
+        "--background",
+        job.blend,
+        "--python-exit-code",
+        "1",
+        "--python",
+        str(HEADLESS_SCRIPT),
+        "--",
+        "--output",
+        job.output,
+        "--job",
+        str(job_path),
+        "--report",
+        str(report_path),
+        "--validate",
+    ]
+    try:
+        proc = subprocess.run(  # noqa: S603
+            blender_args,
+            capture_output=True,
+            encoding="UTF-8",
+            errors="replace",
+            timeout=timeout,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return None, {}, f"Timed out after {timeout} seconds"
+
+    try:
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        report = {}
+    return proc.returncode, report, proc.stderr
+
+
+def run_job(
+    blender: str,
+    job: BatchJob,
+    retries: int,
+    timeout: float | None,
+) -> BatchResult:
+    result = BatchResult(blend=job.blend, output=job.output)
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="yfx_batch_") as temp_dir:
+        for _ in range(retries + 1):
+            result.attempts += 1
+            returncode, report, stderr = run_attempt(
+                blender,
+                job,
+                Path(temp_dir),
+                timeout,
+            )
+            result.returncode = returncode
+            result.validation = report.get("validation", [])
+
+            if returncode == 0 and report.get("status") == "success":
+                result.status = "success"
+                result.error = ""
+                break
+
+            result.error = report.get("error") or stderr[-ERROR_TAIL_LENGTH:]
+
+            # Validation errors are not fixed by retrying
+            if any(res["category"] == "ERROR" for res in result.validation):
+                break
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def run_batch(
+    blender: str,
+    jobs: list,
+    job_count: int,
+    retries: int,
+    timeout: float | None,
+) -> list:
+    """
+    Export all jobs with a bounded pool of Blender processes.
+
+    Failed jobs are recorded in the result and do not stop the batch.
+
+    Returns:
+    - list: BatchResult list in manifest order.
+    """
+    with ThreadPoolExecutor(max_workers=job_count) as executor:
+        futures = [
+            executor.submit(run_job, blender, job, retries, timeout) for job in jobs
+        ]
+        for i, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            print(  # noqa: T201
+                f"[{i}/{len(jobs)}] {result.status}: {result.blend} "
+                f"({result.elapsed:.1f}s)",
+                flush=True,
+            )
+    return [future.result() for future in futures]
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="batch.py")
+    parser.add_argument("manifest", type=Path, help="Manifest JSON file")
+    parser.add_argument(
+        "--blender",
+        type=str,
+        default=os.environ.get("BLENDER_PATH", "blender"),
+        help="Blender executable (default: $BLENDER_PATH or blender)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Concurrent processes (default: from core count and memory budget)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="Memory for the whole batch in GB (default: physical memory)",
+    )
+    parser.add_argument(
+        "--memory-per-job",
+        type=float,
+        default=2.0,
+        help="Expected peak memory of one process in GB",
+    )
+    parser.add_argument("--retries", type=int, default=1, help="Retries per file")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Timeout per attempt in seconds",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=Path("yfx_batch_summary.json"),
+        help="Summary JSON file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list) -> int:
+    args = parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    job_count = get_job_count(args.jobs, args.memory_budget, args.memory_per_job)
+
+    start = time.perf_counter()
+    results = run_batch(args.blender, jobs, job_count, args.retries, args.timeout)
+    failed = sum(result.status != "success" for result in results)
+
+    summary = {
+        "jobs": job_count,
+        "elapsed": time.perf_counter() - start,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "results": [asdict(result) for result in results],
+    }
+    with args.summary.open("w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,53 @@
+# ruff: noqa: INP001
+"""
+Measure the startup cost of the add-on.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_startup.py
+
+The add-on is imported and registered twice: first without the registration
+order cache (cold), then with the cache written by the first run (warm).
+"""
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).resolve().parent.parent
+PACKAGE_NAME = ADDON_DIR.name
+
+
+def unload_addon() -> None:
+    for name in list(sys.modules):
+        if name == PACKAGE_NAME or name.startswith(PACKAGE_NAME + "."):
+            del sys.modules[name]
+
+
+def measure() -> tuple[float, float]:
+    start = time.perf_counter()
+    addon = importlib.import_module(PACKAGE_NAME)
+    imported = time.perf_counter()
+    addon.register()
+    registered = time.perf_counter()
+    addon.unregister()
+    unload_addon()
+    return imported - start, registered - imported
+
+
+def main() -> None:
+    sys.path.insert(0, str(ADDON_DIR.parent))
+
+    cache_path = ADDON_DIR / "__pycache__" / "auto_load_cache.json"
+    cache_path.unlink(missing_ok=True)
+
+    for label in ("cold", "warm"):
+        import_time, register_time = measure()
+        print(  # noqa: T201
+            f"{label}: import {import_time * 1000:.1f} ms, "
+            f"register {register_time * 1000:.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
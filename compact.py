@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import bpy
+import numpy as np
+
+from .protocol import check_cancelled, emit
+from .shapekey import get_shapekey_co
+
+# Bytes per vertex of an FBX blendshape: index (int32), vertex and normal (3 x f64)
+FBX_BYTES_PER_SHAPE_VERTEX = 4 + 24 + 24
+
+
+@dataclass
+class CompactionResult:
+    name: str
+    vertices_before: int
+    vertices_after: int
+
+    def get_saved_bytes(self) -> int:
+        return (self.vertices_before - self.vertices_after) * FBX_BYTES_PER_SHAPE_VERTEX
+
+
+def compact_offsets(
+    offsets: np.ndarray,
+    threshold: float,
+    step: float | None,
+) -> np.ndarray:
+    """
+    Snap short offsets to zero and optionally round them to a grid.
+
+    Parameters:
+    - offsets (np.ndarray): (N, 3) shapekey offsets.
+    - threshold (float): Offsets shorter than this are set to zero.
+    - step (float | None): Grid size. No quantization if None.
+
+    Returns:
+    - np.ndarray: Compacted offsets.
+    """
+    offsets = np.where(
+        (np.linalg.norm(offsets, axis=1) < threshold)[:, np.newaxis],
+        0.0,
+        offsets,
+    )
+    if step is not None:
+        offsets = np.round(offsets / step) * step
+    return offsets.astype(np.float32)
+
+
+def get_relative_key_order(key_blocks: bpy.types.AnyType) -> list:
+    """
+    Return shapekeys except the basis, each after its relative key.
+
+    Keys in relative key cycles (e.g. relative to themselves) come last.
+    """
+    done = {key_blocks[0].name}
+    order = []
+    pending = list(key_blocks[1:])
+    while len(pending) > 0:
+        ready = [key for key in pending if key.relative_key.name in done]
+        if len(ready) == 0:
+            order.extend(pending)
+            break
+        order.extend(ready)
+        done.update(key.name for key in ready)
+        pending = [key for key in pending if key.name not in done]
+    return order
+
+
+def compact_shapekeys(
+    obj: bpy.types.Object,
+    shapekey_settings: bpy.types.AnyType,
+) -> list:
+    """
+    Compact offsets of all shapekeys of the object.
+
+    The FBX exporter only writes vertices whose offset is not exactly zero,
+    so snapping noise to zero shrinks every blendshape.
+
+    Keys are processed after their relative keys, and compacted offsets are
+    added to the compacted relative key. So the offset between a key and its
+    relative key stays zero or on the grid, and dependent keys keep their
+    offsets.
+
+    Returns:
+    - list: CompactionResult of each shapekey.
+    """
+    shapekeys = obj.data.shape_keys
+    if shapekeys is None or len(shapekeys.key_blocks) <= 1:
+        return []
+
+    step = (
+        shapekey_settings.quantize_step if shapekey_settings.quantize_deltas else None
+    )
+    threshold = shapekey_settings.delta_threshold
+
+    # Offsets are computed from the coordinates before any key is modified
+    key_blocks = shapekeys.key_blocks
+    coordinates = {key.name: get_shapekey_co(key) for key in key_blocks}
+    compacted_coordinates = {key_blocks[0].name: coordinates[key_blocks[0].name]}
+
+    results = []
+    for key in get_relative_key_order(key_blocks):
+        check_cancelled()
+
+        relative_name = key.relative_key.name
+        offsets = coordinates[key.name] - coordinates[relative_name]
+        compacted = compact_offsets(offsets, threshold, step)
+        compacted_co = (
+            compacted_coordinates.get(relative_name, coordinates[relative_name])
+            + compacted
+        )
+        key.data.foreach_set("co", compacted_co.ravel())
+        compacted_coordinates[key.name] = compacted_co
+
+        results.append(
+            CompactionResult(
+                name=key.name,
+                vertices_before=int(np.count_nonzero(np.any(offsets, axis=1))),
+                vertices_after=int(np.count_nonzero(np.any(compacted, axis=1))),
+            ),
+        )
+
+    return results
+
+
+def report_compaction(obj: bpy.types.Object, results: list) -> None:
+    for result in results:
+        emit(
+            "stats",
+            object=obj.name,
+            shapekey=result.name,
+            vertices_before=result.vertices_before,
+            vertices_after=result.vertices_after,
+            saved_bytes=result.get_saved_bytes(),
+        )
+
+    emit(
+        "stats",
+        object=obj.name,
+        saved_bytes=sum(result.get_saved_bytes() for result in results),
+    )
@@ -0,0 +1,101 @@
+import bpy
+
+CONVERTIBLE_TYPES = ("CURVE", "FONT", "SURFACE")
+
+
+def copy_animation_data(source: bpy.types.Object, target: bpy.types.Object) -> None:
+    """Copy the action and the drivers of the object."""
+    animation_data = source.animation_data
+    if animation_data is None:
+        return
+
+    target_animation_data = target.animation_data_create()
+    target_animation_data.action = animation_data.action
+    for fcurve in animation_data.drivers:
+        target_animation_data.drivers.from_existing(src_driver=fcurve)
+
+
+def replace_object_data(
+    obj: bpy.types.Object,
+    mesh: bpy.types.Mesh,
+) -> bpy.types.Object:
+    """
+    Replace the object with a new mesh object keeping its name and transform.
+
+    Parent, transform, visibility, custom properties, materials, the action
+    and drivers are kept. Constraints are not, they are baked before.
+
+    Parameters:
+    - obj (bpy.types.Object): The object to replace. It is removed.
+    - mesh (bpy.types.Mesh): Mesh data of the new object.
+
+    Returns:
+    - bpy.types.Object: The new mesh object.
+    """
+    name = obj.name
+    data = obj.data
+
+    mesh_obj = bpy.data.objects.new(name, mesh)
+    for collection in obj.users_collection:
+        collection.objects.link(mesh_obj)
+
+    mesh_obj.parent = obj.parent
+    mesh_obj.parent_type = obj.parent_type
+    mesh_obj.parent_bone = obj.parent_bone
+    mesh_obj.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+    mesh_obj.matrix_basis = obj.matrix_basis.copy()
+    mesh_obj.hide_viewport = obj.hide_viewport
+    mesh_obj.hide_render = obj.hide_render
+
+    mesh_obj.pass_index = obj.pass_index
+    mesh_obj.color = obj.color
+
+    # Custom properties are written to the FBX
+    for key in obj.keys():  # noqa: SIM118 (ID properties have no __iter__)
+        mesh_obj[key] = obj[key]
+
+    copy_animation_data(obj, mesh_obj)
+
+    # Materials linked to the object are not included in the evaluated mesh
+    for i, slot in enumerate(obj.material_slots):
+        if slot.link == "OBJECT" and i < len(mesh.materials):
+            mesh.materials[i] = slot.material
+
+    for child in obj.children:
+        child.parent = mesh_obj
+
+    bpy.data.objects.remove(obj)
+    if data.users == 0:
+        bpy.data.curves.remove(data)
+
+    mesh_obj.name = name
+    return mesh_obj
+
+
+def convert_to_mesh(objects: list, depsgraph: bpy.types.Depsgraph) -> list:
+    """
+    Convert Curve, Text and Surface objects to Mesh without bpy.ops.
+
+    All meshes are built from the same depsgraph evaluation before any object
+    is replaced, so the conversion does not depend on selection or context.
+
+    Parameters:
+    - objects (list): Objects to convert. They are removed after conversion.
+    - depsgraph (bpy.types.Depsgraph): Evaluated dependency graph.
+
+    Returns:
+    - list: The converted mesh objects.
+    """
+    targets = [obj for obj in objects if obj.type in CONVERTIBLE_TYPES]
+    meshes = [
+        bpy.data.meshes.new_from_object(
+            obj.evaluated_get(depsgraph),
+            preserve_all_data_layers=True,
+            depsgraph=depsgraph,
+        )
+        for obj in targets
+    ]
+    return [
+        replace_object_data(obj, mesh)
+        for obj, mesh in zip(targets, meshes, strict=True)
+    ]
@@ -0,0 +1,61 @@
+from collections.abc import Callable
+
+import bpy
+
+# Number of bpy.ops calls in the current export
+operator_call_count = 0
+
+
+def reset_operator_call_count() -> None:
+    global operator_call_count  # noqa: PLW0603
+    operator_call_count = 0
+
+
+def get_operator_call_count() -> int:
+    return operator_call_count
+
+
+def call_operator(
+    operator: Callable,
+    override: dict | None = None,
+    **kwargs: bpy.types.AnyType,
+) -> set:
+    """
+    Call an operator that has no data API alternative.
+
+    Parameters:
+    - operator (Callable): bpy.ops operator. (e.g. bpy.ops.object.join)
+    - override (dict | None): Context members passed to bpy.context.temp_override.
+    - kwargs: Operator properties.
+
+    Returns:
+    - set: Result of the operator.
+    """
+    global operator_call_count  # noqa: PLW0603
+    operator_call_count += 1
+
+    if override is None:
+        return operator(**kwargs)
+
+    with bpy.context.temp_override(**override):
+        return operator(**kwargs)
+
+
+def deselect_all_objects(view_layer: bpy.types.ViewLayer) -> None:
+    for obj in view_layer.objects.selected:
+        obj.select_set(state=False)
+
+
+def select_objects(view_layer: bpy.types.ViewLayer, objects: list) -> None:
+    deselect_all_objects(view_layer)
+    for obj in objects:
+        if obj.visible_get(view_layer=view_layer):
+            obj.select_set(state=True, view_layer=view_layer)
+
+
+def remove_object(obj: bpy.types.Object) -> None:
+    """Remove the object and its mesh if the mesh is no longer used."""
+    data = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if isinstance(data, bpy.types.Mesh) and data.users == 0:
+        bpy.data.meshes.remove(data)
@@ -1,11 +1,33 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
 from typing import Generator
 
 import bpy
 import bpy_types
 
+from .armature import ArmatureCache
+from .backends import get_export_backends
+from .compact import compact_shapekeys, report_compaction
+from .convert import CONVERTIBLE_TYPES, convert_to_mesh
+from .core import (
+    call_operator,
+    get_operator_call_count,
+    reset_operator_call_count,
+    select_objects,
+)
+from .lod import generate_lods
+from .material import merge_material_slots, report_draw_calls
+from .memory import get_memory_budget_error, purge_orphan_data
 from .merge import merge_objects
 from .modifier import main_apply_modifiers
+from .output import commit_output, get_partial_path
+from .protocol import emit, report_progress, report_stage
 from .shapekey import separate_shapekey_lr, sort_shapekey
+from .transform import apply_transform
+from .weights import limit_bone_influences
+from .weld import weld_seams
 
 
 class ExportError(Exception):
@@ -13,9 +35,10 @@ class ExportError(Exception):
 
 
 def make_all_unlink() -> None:
-    bpy.ops.object.duplicates_make_real(use_hierarchy=True)
-    bpy.ops.object.make_local(type="ALL")
-    bpy.ops.object.make_single_user(
+    call_operator(bpy.ops.object.duplicates_make_real, use_hierarchy=True)
+    call_operator(bpy.ops.object.make_local, type="ALL")
+    call_operator(
+        bpy.ops.object.make_single_user,
         type="ALL",
         object=True,
         obdata=True,
@@ -25,31 +48,154 @@ def make_all_unlink() -> None:
     )
 
 
-def apply_constraints(obj: bpy.types.Object) -> None:
-    names = [constraint.name for constraint in obj.constraints]
-    for name in names:
-        bpy.ops.constraint.apply(constraint=name)
+def make_selected_unlink() -> None:
+    call_operator(bpy.ops.object.make_local, type="SELECT_OBDATA_MATERIAL")
+    call_operator(
+        bpy.ops.object.make_single_user,
+        type="SELECTED_OBJECTS",
+        object=True,
+        obdata=True,
+        material=False,
+        animation=False,
+        obdata_animation=False,
+    )
+
+
+def iter_object_dependencies(
+    obj: bpy.types.Object,
+) -> Generator[bpy.types.Object, None, None]:
+    yield obj.parent
+    yield obj.find_armature()
+
+    for modifier in obj.modifiers:
+        yield getattr(modifier, "object", None)
+
+    for constraint in obj.constraints:
+        yield getattr(constraint, "target", None)
+
+    if obj.instance_type == "COLLECTION" and obj.instance_collection:
+        yield from obj.instance_collection.all_objects
+
+
+def get_export_scope(collection_settings: bpy.types.AnyType) -> set:
+    """
+    Get objects reachable from the merge collections.
+
+    Parameters:
+    - collection_settings (bpy.types.AnyType): Merge collection settings.
+
+    Returns:
+    - set: Objects in the merge collections, their armatures, parents,
+           modifier objects and constraint targets.
+    """
+    scope = set()
+    stack = [
+        obj
+        for c in collection_settings
+        if c.collection_ptr
+        for obj in c.collection_ptr.all_objects
+    ]
+    while stack:
+        obj = stack.pop()
+        if obj is None or obj in scope:
+            continue
+        scope.add(obj)
+        stack.extend(iter_object_dependencies(obj))
+
+    return scope
+
+
+def make_scope_unlink(
+    context: bpy_types.Context,
+    collection_settings: bpy.types.AnyType,
+) -> set:
+    view_layer = context.view_layer
+
+    # Realize instances in the scope. The realized objects join the scope
+    select_objects(view_layer, get_export_scope(collection_settings))
+    call_operator(bpy.ops.object.duplicates_make_real, use_hierarchy=True)
+
+    scope = get_export_scope(collection_settings)
+    select_objects(view_layer, scope)
+    make_selected_unlink()
+    return get_export_scope(collection_settings)
+
 
+def get_parent_depth(obj: bpy.types.Object) -> int:
+    depth = 0
+    while obj.parent is not None:
+        obj = obj.parent
+        depth += 1
+    return depth
 
-def apply_all_objects(context: bpy_types.Context) -> None:
+
+def bake_constraints(context: bpy_types.Context, objects: list) -> None:
+    """
+    Bake constraints of the objects into plain transforms.
+
+    The world matrices of all constrained objects are read from a single
+    depsgraph evaluation, then the constraints are cleared.
+
+    Parameters:
+    - context (bpy_types.Context): Context
+    - objects (list): Target objects.
+    """
+    constrained = [obj for obj in objects if len(obj.constraints) > 0]
+    if len(constrained) == 0:
+        return
+
+    depsgraph = context.evaluated_depsgraph_get()
+    matrices = {
+        obj: obj.evaluated_get(depsgraph).matrix_world.copy() for obj in constrained
+    }
+
+    # Parents first, children are computed from the baked parent transforms
+    for obj in sorted(constrained, key=get_parent_depth):
+        obj.constraints.clear()
+        obj.matrix_world = matrices[obj]
+
+
+def apply_all_objects(
+    context: bpy_types.Context,
+    collection_settings: bpy.types.AnyType = None,
+) -> None:
+    """
+    Apply constraints, convert objects to mesh and apply modifiers.
+
+    Parameters:
+    - context (bpy_types.Context): Context
+    - collection_settings (bpy.types.AnyType): If specified, only the objects
+      reachable from the merge collections are processed.
+    """
     scn = context.scene
 
-    bpy.ops.object.select_all(action="SELECT")
-    make_all_unlink()
+    if collection_settings is None:
+        scope = None
+        select_objects(context.view_layer, scn.objects)
+        make_all_unlink()
+    else:
+        scope = make_scope_unlink(context, collection_settings)
 
-    for obj in scn.objects:
-        if obj.visible_get() and obj.type in ("CURVE", "FONT", "SURFACE", "MESH"):
-            context.view_layer.objects.active = obj
-            bpy.ops.object.select_all(action="DESELECT")
-            obj.select_set(state=True)
+    objects = [
+        obj
+        for obj in scn.objects
+        if (scope is None or obj in scope)
+        and obj.visible_get()
+        and obj.type in (*CONVERTIBLE_TYPES, "MESH")
+    ]
 
-            apply_constraints(obj)
+    bake_constraints(context, objects)
 
-            if obj.type in ("CURVE", "FONT", "SURFACE"):
-                # Convert object to mesh
-                bpy.ops.object.convert(target="MESH")
+    mesh_objects = [obj for obj in objects if obj.type == "MESH"]
 
-            main_apply_modifiers(obj)
+    # Apply modifiers before the conversion removes curves that
+    # Curve and Array modifiers of the meshes may refer to
+    for i, obj in enumerate(mesh_objects):
+        main_apply_modifiers(obj)
+        report_progress("prepare", (i + 1) / len(mesh_objects))
+
+    # Convert object to mesh. Modifiers are applied by the conversion
+    convert_to_mesh(objects, context.evaluated_depsgraph_get())
 
 
 def get_merge_collections(
@@ -65,7 +211,10 @@ def get_merge_collections(
             yield from get_merge_collections(collection_settings, child)
 
 
-def delete_unused_vertex_group(obj: bpy.types.Object) -> None:
+def delete_unused_vertex_group(
+    obj: bpy.types.Object,
+    armature_cache: ArmatureCache,
+) -> None:
     if len(obj.vertex_groups) == 0:
         return
 
@@ -80,10 +229,7 @@ def delete_unused_vertex_group(obj: bpy.types.Object) -> None:
                 max_weights[group_index] = weight
 
     # Deform vertex groups
-    deform_bone_names = []
-    armature = obj.find_armature()
-    if armature:
-        deform_bone_names = [bone.name for bone in armature.data.bones]
+    deform_bone_names = armature_cache.get_deform_bone_names(obj)
 
     for index, weight in reversed(list(enumerate(max_weights))):
         vertex_group = obj.vertex_groups[index]
@@ -91,51 +237,274 @@ def delete_unused_vertex_group(obj: bpy.types.Object) -> None:
             obj.vertex_groups.remove(obj.vertex_groups[index])
 
 
-def export(context: bpy_types.Context, settings: bpy.types.AnyType) -> None:
-    """Preprocess and Export file"""
+def process_merged_object(
+    obj: bpy.types.Object,
+    c: bpy.types.AnyType,
+    armature_cache: ArmatureCache,
+) -> None:
+    """Post merge process set for each merge collection"""
+    if c.transform_settings.apply_all_transform:
+        apply_transform(obj)
+
+    if c.weld_settings.weld_vertices:
+        weld_seams(obj, c.weld_settings)
+
+    if c.material_settings.merge_material_slots:
+        report_draw_calls(obj, *merge_material_slots(obj, c.material_settings))
+
+    sort_shapekey(obj, c.shapekey_settings)
+
+    separate_shapekey_lr(obj, c.shapekey_settings)
+
+    if c.shapekey_settings.compact_shapekeys:
+        report_compaction(obj, compact_shapekeys(obj, c.shapekey_settings))
+
+    if c.vertex_group_settings.delete_vertex_group:
+        delete_unused_vertex_group(obj, armature_cache)
+
+    if c.vertex_group_settings.limit_influences:
+        limit_bone_influences(obj, c.vertex_group_settings, armature_cache)
+
+
+def generate_collection_lods(
+    obj: bpy.types.Object,
+    c: bpy.types.AnyType,
+    armature_cache: ArmatureCache,
+) -> list:
+    """Generate LODs of the merged object and post-process each level."""
+    lod_objects = generate_lods(obj, c.lod_settings)
+
+    # Decimation interpolates weights, so limit them again
+    if c.vertex_group_settings.limit_influences:
+        for lod_obj in lod_objects:
+            limit_bone_influences(lod_obj, c.vertex_group_settings, armature_cache)
+
+    return lod_objects
+
+
+def get_split_export_path(export_path: str, collection_name: str) -> str:
+    """Return "{stem}_{collection}{ext}" next to the export path."""
+    path = Path(export_path)
+    name = bpy.path.clean_name(collection_name)
+    return str(path.with_name(f"{path.stem}_{name}{path.suffix}"))
+
+
+def get_split_objects(obj: bpy.types.Object, armature_cache: ArmatureCache) -> list:
+    """Return the merged object and its armature."""
+    objects = [obj]
+    armature = armature_cache.get_armature(obj)
+    if armature is not None:
+        objects.append(armature)
+    return objects
+
+
+def get_export_targets(
+    context: bpy_types.Context,
+    export_settings: bpy.types.AnyType,
+    export_path: str,
+    merged_objects: dict,
+    lod_objects: dict,
+    *,
+    armature_cache: ArmatureCache,
+) -> list:
+    """
+    Decide the output files and the objects written to each file.
+
+    Returns:
+    - list: (export path, objects) pairs. If objects is None, all visible
+      objects are exported.
+    """
+    separate_lod = export_settings.lod_output == "SEPARATE_FILES"
+
+    if export_settings.split_by_collection:
+        targets = []
+        for name, obj in merged_objects.items():
+            path = get_split_export_path(export_path, name)
+            lods = lod_objects.get(name, [])
+            if separate_lod:
+                targets.append((path, get_split_objects(obj, armature_cache)))
+                targets.extend(
+                    (
+                        get_split_export_path(path, f"LOD{level}"),
+                        get_split_objects(lod, armature_cache),
+                    )
+                    for level, lod in enumerate(lods, 1)
+                )
+            else:
+                lod_split_objects = [
+                    get_split_objects(lod, armature_cache) for lod in lods
+                ]
+                objects = set(get_split_objects(obj, armature_cache)).union(
+                    *lod_split_objects,
+                )
+                targets.append((path, list(objects)))
+        return targets
+
+    if not separate_lod or len(lod_objects) == 0:
+        return [(export_path, None)]
+
+    all_lods = set(chain.from_iterable(lod_objects.values()))
+    targets = [
+        (
+            export_path,
+            [
+                obj
+                for obj in context.scene.objects
+                if obj.visible_get() and obj not in all_lods
+            ],
+        ),
+    ]
+    max_level = max(len(lods) for lods in lod_objects.values())
+    for level in range(1, max_level + 1):
+        lods = [objs[level - 1] for objs in lod_objects.values() if len(objs) >= level]
+        objects = set().union(*(get_split_objects(lod, armature_cache) for lod in lods))
+        targets.append(
+            (get_split_export_path(export_path, f"LOD{level}"), list(objects)),
+        )
+    return targets
+
+
+def write_outputs(
+    context: bpy_types.Context,
+    export_settings: bpy.types.AnyType,
+    targets: list,
+) -> bool:
+    """
+    Write every target with every enabled backend.
+
+    Exporters run one at a time in the main thread. Hashing, fsync and rename
+    of a written file run in a worker thread while the next file is exported.
+
+    Parameters:
+    - context (bpy_types.Context): Context
+    - export_settings (bpy.types.AnyType): Export settings
+    - targets (list): (export path, objects) pairs. If objects is None, all
+      visible objects are exported.
+
+    Returns:
+    - bool: True if any output file was written, False if all were unchanged.
+    """
+    backends = get_export_backends(export_settings)
+    total = len(targets) * len(backends)
+
+    commits = []
+    with ThreadPoolExecutor() as executor:
+        for path, objects in targets:
+            for backend in backends:
+                output_path = backend.get_output_path(path)
+                partial_path = get_partial_path(
+                    output_path,
+                    keep_extension=backend.forces_extension,
+                )
+                # The parent removes announced partial files if the export stops
+                emit("partial", path=partial_path)
+                with report_stage(f"export_{backend.name.lower()}"):
+                    if objects is None:
+                        backend.write(export_settings, partial_path)
+                    else:
+                        select_objects(context.view_layer, objects)
+                        backend.write(export_settings, partial_path, use_selection=True)
+
+                future = executor.submit(commit_output, partial_path, output_path)
+                commits.append((output_path, future))
+                report_progress("export", len(commits) / total)
+
+    changed = False
+    for output_path, future in commits:
+        output_changed = future.result()
+        emit("output", path=output_path, changed=output_changed)
+        changed = changed or output_changed
+    return changed
+
+
+def export(context: bpy_types.Context, settings: bpy.types.AnyType) -> bool:
+    """
+    Preprocess and Export file
+
+    Returns:
+    - bool: True if any output file was written, False if all were unchanged.
+    """
     scn = context.scene
     export_settings = settings.export_settings
     collection_settings = export_settings.collections
 
+    reset_operator_call_count()
+
+    # Fail before any work rather than running out of memory at the end
+    memory_error = get_memory_budget_error(scn, export_settings)
+    if memory_error is not None:
+        raise ExportError(memory_error)
+    # Purging is recursive and would also free data of the user's session
+    purge_unused_data = export_settings.memory_budget > 0 and bpy.app.background
+
     # Convert object to mesh and Apply modifiers
-    apply_all_objects(context)
+    with report_stage("prepare"):
+        if export_settings.limit_to_merge_collections:
+            apply_all_objects(context, collection_settings)
+        else:
+            apply_all_objects(context)
 
     # Merge objects
     collection_settings_dict = {c.collection_ptr.name: c for c in collection_settings}
 
-    merge_collections = get_merge_collections(
-        collection_settings_dict,
-        scn.collection,
+    merge_collections = list(
+        get_merge_collections(
+            collection_settings_dict,
+            scn.collection,
+        ),
     )
 
-    for c in merge_collections:
-        merge_objects(context, c.collection_ptr)
-
-        obj = context.view_layer.objects.active
-
-        # Post merge process
-        if c.transform_settings.apply_all_transform:
-            bpy.ops.object.transform_apply(
-                location=True,
-                rotation=True,
-                scale=True,
-                properties=False,
+    armature_cache = ArmatureCache()
+    merged_objects = {}  # key: collection name, value: merged object
+    with report_stage("merge"):
+        for i, c in enumerate(merge_collections):
+            start = time.perf_counter()
+            obj = merge_objects(context, c.collection_ptr)
+            if obj is not None:
+                process_merged_object(obj, c, armature_cache)
+                merged_objects[c.collection_ptr.name] = obj
+
+            if purge_unused_data:
+                purge_orphan_data()
+
+            emit(
+                "timing",
+                name=f"merge:{c.collection_ptr.name}",
+                seconds=time.perf_counter() - start,
             )
+            report_progress("merge", (i + 1) / len(merge_collections))
+
+    lod_objects = {}  # key: collection name, value: LOD objects by level
+    with report_stage("lod"):
+        for c in merge_collections:
+            name = c.collection_ptr.name
+            lod_settings = c.lod_settings
+            if (
+                name in merged_objects
+                and lod_settings.generate_lod
+                and len(lod_settings.levels) > 0
+            ):
+                lod_objects[name] = generate_collection_lods(
+                    merged_objects[name],
+                    c,
+                    armature_cache,
+                )
+
+    if purge_unused_data:
+        purge_orphan_data()
+
+    # Write all formats from the same preprocessed scene
+    export_path = bpy.path.abspath(export_settings.export_path)
+    targets = get_export_targets(
+        context,
+        export_settings,
+        export_path,
+        merged_objects,
+        lod_objects,
+        armature_cache=armature_cache,
+    )
+    changed = write_outputs(context, export_settings, targets)
 
-        sort_shapekey(obj, c.shapekey_settings)
-
-        separate_shapekey_lr(obj, c.shapekey_settings)
-
-        if c.vertex_group_settings.delete_vertex_group:
-            delete_unused_vertex_group(obj)
+    emit("stats", operator_calls=get_operator_call_count())
 
-    # Export to fbx
-    fbx_export_settings = export_settings.fbx_export_settings
-    keyargs_dict = {
-        key: getattr(fbx_export_settings, key, None)
-        for key in fbx_export_settings.__annotations__
-    }
-    bpy.ops.export_scene.fbx(
-        filepath=export_settings.export_path,
-        **keyargs_dict,
-    )
+    return changed
@@ -0,0 +1,196 @@
+"""
+Headless entry point for export workers.
+
+Only the property groups and the export engine are registered. Panels, UI lists
+and translations are skipped, so Blender starts faster than with --addons.
+
+Usage:
+    blender --background --factory-startup scene.blend --python headless.py -- \
+        --output out.fbx [--job job.json] [--validate] [--report report.json]
+
+The job file is a JSON object. All keys are optional.
+    {
+        "output": "//export/out.fbx",
+        "validate": true,
+        "settings": {"export_settings": {"apply_scale_options": "FBX_SCALE_ALL"}}
+    }
+"settings" is applied to Scene.yfx_exporter_settings. Enum flag properties take
+a list (e.g. "export_formats": ["FBX", "GLTF"]). Command line arguments take
+precedence over the job file.
+
+Progress is written to stdout with the line protocol of protocol.py.
+With --report, the status, elapsed time and validation results are written
+to a JSON file for batch drivers. The export stops at the next checkpoint
+once the file given by --cancel-file exists.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+ADDON_DIR = Path(__file__).resolve().parent
+PACKAGE_NAME = ADDON_DIR.name
+
+
+class JobError(Exception):
+    pass
+
+
+def import_addon_module(name: str):  # noqa: ANN201
+    if str(ADDON_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(ADDON_DIR.parent))
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+
+def register_properties() -> None:
+    """Register the property groups of the add-on without any UI classes."""
+    auto_load = import_addon_module("auto_load")
+    properties = import_addon_module("properties")
+
+    for cls in auto_load.get_ordered_classes_to_register([properties]):
+        bpy.utils.register_class(cls)
+    properties.register()
+
+
+def convert_json_value(prop: bpy.types.Property | None, value: object) -> object:
+    # JSON has no sets, enum flag properties only accept them
+    if isinstance(value, list) and getattr(prop, "is_enum_flag", False):
+        return set(value)
+    return value
+
+
+def apply_settings(settings: bpy.types.PropertyGroup, values: dict) -> None:
+    """
+    Assign nested values to the property group.
+
+    Parameters:
+    - settings (bpy.types.PropertyGroup): The target property group.
+    - values (dict): Property values. Nested dicts are applied to pointer properties,
+      lists to enum flag properties.
+    """
+    for key, value in values.items():
+        if not hasattr(settings, key):
+            msg = f"Unknown setting: {key}"
+            raise JobError(msg)
+
+        if isinstance(value, dict):
+            apply_settings(getattr(settings, key), value)
+            continue
+
+        prop = settings.bl_rna.properties.get(key)
+        try:
+            setattr(settings, key, convert_json_value(prop, value))
+        except (AttributeError, TypeError, ValueError) as e:
+            msg = f"Invalid setting {key}: {e}"
+            raise JobError(msg) from e
+
+
+def load_job(args: argparse.Namespace) -> dict:
+    job = {}
+    if args.job is not None:
+        try:
+            job = json.loads(Path(args.job).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            msg = f"Failed to read job file: {e}"
+            raise JobError(msg) from e
+
+    if args.output is not None:
+        job["output"] = args.output
+    if args.validate:
+        job["validate"] = True
+    return job
+
+
+def run_job(job: dict, report: dict) -> None:
+    protocol = import_addon_module("protocol")
+    context = bpy.context
+    settings = context.scene.yfx_exporter_settings
+    apply_settings(settings, job.get("settings", {}))
+    if "output" in job:
+        settings.export_settings.export_path = job["output"]
+
+    if job.get("validate", False):
+        utils = import_addon_module("utils")
+        validator = import_addon_module("validator")
+        utils.update_all_setting_items(context)
+        results = validator.validate(context)
+        report["validation"] = [
+            {"code": res.code, "category": res.category.value, "message": res.message}
+            for res in results
+        ]
+        for res in report["validation"]:
+            protocol.emit("validation", **res)
+        errors = [
+            res.message
+            for res in results
+            if res.category == validator.ErrorCategory.ERROR
+        ]
+        if errors:
+            raise JobError("\n".join(errors))
+
+    exporter = import_addon_module("exporter")
+    exporter.export(context, settings)
+
+
+def write_report(path: str, report: dict) -> None:
+    with Path(path).open("w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="headless.py")
+    parser.add_argument("--output", type=str, help="Export file path")
+    parser.add_argument("--job", type=str, help="Job description JSON file")
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate the scene before export",
+    )
+    parser.add_argument("--report", type=str, help="Write a JSON report file")
+    parser.add_argument(
+        "--cancel-file",
+        type=Path,
+        help="Cancel the export when this file exists",
+    )
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    args = parse_args(argv)
+
+    start = time.perf_counter()
+    report = {"status": "failed", "validation": []}
+
+    register_properties()
+    exporter = import_addon_module("exporter")
+    protocol = import_addon_module("protocol")
+    protocol.set_listener(protocol.write_event_line)
+    protocol.set_cancel_path(args.cancel_file)
+    try:
+        run_job(load_job(args), report)
+        report["status"] = "success"
+    except (JobError, exporter.ExportError) as e:
+        report["error"] = str(e)
+        protocol.emit("error", message=str(e))
+        sys.stderr.write(f"{e}\n")
+    except protocol.ExportCancelledError:
+        report["status"] = "cancelled"
+        protocol.emit("cancelled")
+    finally:
+        report["elapsed"] = time.perf_counter() - start
+        report["peak_memory"] = import_addon_module("memory").get_peak_memory()
+        if args.report is not None:
+            write_report(args.report, report)
+
+    if report["status"] != "success":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Registry of running background exports."""
+
+import itertools
+
+# key: job id, value: BackgroundExportJob
+running_jobs = {}
+
+job_ids = itertools.count(1)
+
+
+def add_job(job: object) -> int:
+    job_id = next(job_ids)
+    running_jobs[job_id] = job
+    return job_id
+
+
+def get_job(job_id: int) -> object | None:
+    return running_jobs.get(job_id)
+
+
+def remove_job(job_id: int) -> None:
+    running_jobs.pop(job_id, None)
+
+
+def has_running_jobs() -> bool:
+    return len(running_jobs) > 0
+
+
+def cancel_all_jobs() -> None:
+    for job in running_jobs.values():
+        job.cancel()
+
+
+def unregister() -> None:
+    # Do not leave export processes behind when the add-on is disabled
+    for job in running_jobs.values():
+        job.kill()
+    running_jobs.clear()
@@ -0,0 +1,177 @@
+import bpy
+import numpy as np
+
+from .modifier import apply_all_modifiers
+from .protocol import check_cancelled, report_progress
+from .shapekey import copy_shapekey_settings, get_shapekey_co
+from .weld import get_nearest_points
+
+SEAM_VERTEX_GROUP_NAME = "_yfx_lod_seam"
+
+# Cost weight of seam vertices in the Decimate modifier (its maximum)
+SEAM_VERTEX_GROUP_FACTOR = 1000.0
+
+
+def get_lod_name(name: str, level: int) -> str:
+    return f"{name}_LOD{level}"
+
+
+def copy_lod_object(
+    source: bpy.types.Object,
+    base_name: str,
+    level: int,
+) -> bpy.types.Object:
+    """Copy the source geometry to a new object named after the merged object."""
+    lod_obj = source.copy()
+    lod_obj.data = source.data.copy()
+    for collection in source.users_collection:
+        collection.objects.link(lod_obj)
+
+    name = get_lod_name(base_name, level)
+    lod_obj.name = name
+    lod_obj.data.name = name
+    return lod_obj
+
+
+def get_seam_vertices(mesh: bpy.types.Mesh) -> np.ndarray:
+    """
+    Return a mask of vertices on UV seams and UV island boundaries.
+
+    A vertex is on a UV island boundary if its face corners have different UVs.
+    """
+    mask = np.zeros(len(mesh.vertices), dtype=bool)
+
+    use_seam = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", use_seam)
+    edge_vertices = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    mask[edge_vertices.reshape(-1, 2)[use_seam].ravel()] = True
+
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    for uv_layer in mesh.uv_layers:
+        uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uv)
+
+        # Count distinct UVs per vertex
+        keys = np.column_stack(
+            (loop_vertices, np.round(uv.reshape(-1, 2) * 1e5).astype(np.int64)),
+        )
+        unique_vertices = np.unique(keys, axis=0)[:, 0]
+        counts = np.bincount(unique_vertices, minlength=len(mesh.vertices))
+        mask |= counts > 1
+
+    return mask
+
+
+def decimate(obj: bpy.types.Object, ratio: float, *, preserve_uv_seams: bool) -> None:
+    """Collapse the mesh of the object that has no shapekeys."""
+    modifier = obj.modifiers.new(name="YFX LOD", type="DECIMATE")
+    modifier.decimate_type = "COLLAPSE"
+    modifier.ratio = ratio
+
+    seam_group = None
+    if preserve_uv_seams:
+        seam_vertices = np.flatnonzero(get_seam_vertices(obj.data))
+        if len(seam_vertices) > 0:
+            seam_group = obj.vertex_groups.new(name=SEAM_VERTEX_GROUP_NAME)
+            seam_group.add(seam_vertices.tolist(), 1.0, "REPLACE")
+            # Collapse only weights the edge cost, seam vertices are collapsed
+            # last but can still be collapsed at low ratios
+            modifier.vertex_group = seam_group.name
+            modifier.invert_vertex_group = True
+            modifier.vertex_group_factor = SEAM_VERTEX_GROUP_FACTOR
+
+    apply_all_modifiers(obj)
+
+    if seam_group is not None:
+        obj.vertex_groups.remove(obj.vertex_groups[SEAM_VERTEX_GROUP_NAME])
+
+
+def get_mean_edge_length(mesh: bpy.types.Mesh, co: np.ndarray) -> float:
+    edge_vertices = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    edge_vertices = edge_vertices.reshape(-1, 2)
+    lengths = np.linalg.norm(co[edge_vertices[:, 0]] - co[edge_vertices[:, 1]], axis=1)
+    mean_length = float(lengths.mean()) if len(lengths) > 0 else 0.0
+    # Cells must not be empty. With tiny cells lookups fall back to the KD tree
+    return max(mean_length, 1e-6)
+
+
+def transfer_shapekeys_nearest(
+    source: bpy.types.Object,
+    target: bpy.types.Object,
+) -> None:
+    """
+    Transfer shapekey offsets to a mesh with different topology.
+
+    Each target vertex takes the offsets of the nearest source basis vertex.
+    """
+    key_blocks = source.data.shape_keys.key_blocks
+    basis_co = get_shapekey_co(key_blocks[0])
+
+    target_co = np.empty(len(target.data.vertices) * 3, dtype=np.float32)
+    target.data.vertices.foreach_get("co", target_co)
+    target_co = target_co.reshape(-1, 3)
+    nearest = get_nearest_points(
+        basis_co,
+        target_co,
+        get_mean_edge_length(source.data, basis_co),
+    )
+
+    target.shape_key_add(name=key_blocks[0].name, from_mix=False)
+    for key in key_blocks[1:]:
+        offset = get_shapekey_co(key) - basis_co
+        target_key = target.shape_key_add(name=key.name, from_mix=False)
+        target_key.data.foreach_set("co", (target_co + offset[nearest]).ravel())
+        copy_shapekey_settings(key, target_key)
+
+    target_keys = target.data.shape_keys.key_blocks
+    for key in key_blocks:
+        target_keys[key.name].relative_key = target_keys[key.relative_key.name]
+
+
+def generate_lods(
+    obj: bpy.types.Object,
+    lod_settings: bpy.types.AnyType,
+) -> list:
+    """
+    Generate LOD objects of the merged object.
+
+    Each level is decimated from the previous level, so higher levels process
+    fewer faces. Ratios are relative to the merged mesh.
+
+    Parameters:
+    - obj (bpy.types.Object): The merged mesh object.
+    - lod_settings (bpy.types.AnyType): LOD settings of the merge collection.
+
+    Returns:
+    - list: LOD objects ordered by level.
+    """
+    ratios = [level.ratio for level in lod_settings.levels]
+    lod_objects = []
+
+    source = obj
+    source_ratio = 1.0
+    for level, ratio in enumerate(ratios, 1):
+        check_cancelled()
+
+        lod_obj = copy_lod_object(source, obj.name, level)
+        has_shapekeys = lod_obj.data.shape_keys is not None
+        if has_shapekeys:
+            lod_obj.shape_key_clear()
+
+        decimate(
+            lod_obj,
+            min(ratio / source_ratio, 1.0),
+            preserve_uv_seams=lod_settings.preserve_uv_seams,
+        )
+        if has_shapekeys and lod_settings.preserve_shapekeys:
+            transfer_shapekeys_nearest(source, lod_obj)
+
+        lod_objects.append(lod_obj)
+        source = lod_obj
+        source_ratio = ratio
+        report_progress("lod", level / len(ratios))
+
+    return lod_objects
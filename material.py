@@ -0,0 +1,76 @@
+import bpy
+import numpy as np
+
+from .protocol import emit
+
+
+def get_material_key(
+    material: bpy.types.Material | None,
+    atlas_key: str | None,
+) -> object:
+    """Return the key of slots drawn together. Empty slots share the key None."""
+    if material is None:
+        return None
+    if atlas_key is not None and atlas_key in material:
+        return ("atlas", str(material[atlas_key]))
+    return material
+
+
+def merge_material_slots(
+    obj: bpy.types.Object,
+    material_settings: bpy.types.AnyType,
+) -> tuple[int, int]:
+    """
+    Merge material slots with the same material and remove unused slots.
+
+    Slots are kept in the order of their first use. If atlas grouping is
+    enabled, materials with the same value of the atlas key custom property
+    are replaced by the first of them.
+
+    Parameters:
+    - obj (bpy.types.Object): The merged mesh object.
+    - material_settings (bpy.types.AnyType): Material settings of the merge collection.
+
+    Returns:
+    - tuple[int, int]: Draw calls (used slots) before and after.
+    """
+    mesh = obj.data
+    slots = obj.material_slots
+    if len(slots) == 0:
+        return 0, 0
+
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    # Out of range indices are drawn with the last slot
+    material_indices = np.minimum(material_indices, len(slots) - 1)
+    # Used slots ordered by the first face using them
+    used_slots, first_faces = np.unique(material_indices, return_index=True)
+    used_slots = used_slots[np.argsort(first_faces)]
+
+    atlas_key = (
+        material_settings.atlas_key if material_settings.group_by_atlas else None
+    )
+    keys = [get_material_key(slot.material, atlas_key) for slot in slots]
+
+    new_slots = {}  # key: material key, value: (new index, material)
+    remap = np.zeros(len(slots), dtype=np.int32)
+    for index in used_slots.tolist():
+        new_index, _ = new_slots.setdefault(
+            keys[index],
+            (len(new_slots), slots[index].material),
+        )
+        remap[index] = new_index
+
+    mesh.polygons.foreach_set("material_index", remap[material_indices])
+
+    for new_index, material in new_slots.values():
+        slots[new_index].material = material
+    while len(mesh.materials) > max(len(new_slots), 1):
+        mesh.materials.pop()
+    mesh.update()
+
+    return len(used_slots), len(new_slots)
+
+
+def report_draw_calls(obj: bpy.types.Object, before: int, after: int) -> None:
+    emit("stats", object=obj.name, draw_calls_before=before, draw_calls_after=after)
@@ -0,0 +1,301 @@
+"""
+Memory estimate and measurement of exports.
+
+The estimate is a rough upper bound of the memory an export needs in addition
+to the loaded scene. It counts a processed copy of every exported mesh and the
+in-memory tree of the FBX writer. Geometry generated by modifiers is not
+counted.
+
+The peak memory of each stage is measured by resetting the high-water mark
+of the process on Linux, and by sampling the current memory elsewhere.
+"""
+
+import ctypes
+import os
+import sys
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import bpy
+from bpy.app.translations import pgettext_tip as tip_
+
+GIB = 1024**3
+
+# Approximate bytes of Blender mesh data (position, flags, indices, attributes)
+MESH_BYTES_PER_VERTEX = 32
+MESH_BYTES_PER_EDGE = 16
+MESH_BYTES_PER_LOOP = 16
+MESH_BYTES_PER_POLYGON = 16
+MESH_BYTES_PER_UV = 8
+MESH_BYTES_PER_SHAPE_VERTEX = 12
+
+# Approximate bytes of FBX writer data (double arrays and Python overhead)
+FBX_BYTES_PER_VERTEX = 48
+FBX_BYTES_PER_LOOP = 64
+FBX_BYTES_PER_UV = 32
+FBX_BYTES_PER_SHAPE_VERTEX = 104
+
+# Seconds between samples where the high-water mark cannot be reset
+MEMORY_SAMPLE_INTERVAL = 0.05
+
+# Peak kept across resets of the high-water mark, which also lower ru_maxrss
+measured_peak_memory = 0
+
+
+@dataclass
+class MemoryMeasurement:
+    peak: int | None = None
+
+
+def get_peak_memory() -> int | None:
+    """
+    Return the peak resident memory of this process in bytes, or None.
+
+    The peak is the high-water mark since the process started.
+    """
+    if sys.platform == "win32":
+        counters = get_memory_counters_windows()
+        return None if counters is None else counters.PeakWorkingSetSize
+
+    import resource  # noqa: PLC0415
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    return max(peak, measured_peak_memory)
+
+
+def reset_high_water_mark() -> bool:
+    """Reset the resident high-water mark of this process. Linux only."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:  # noqa: PTH123
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_high_water_mark() -> int | None:
+    """Return the resident high-water mark (VmHWM) in bytes. Linux only."""
+    try:
+        with open("/proc/self/status") as f:  # noqa: PTH123
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@contextmanager
+def sample_peak_memory(
+    measurement: MemoryMeasurement,
+) -> Generator[None, None, None]:
+    """
+    Sample the current memory in a thread while the block runs.
+
+    Blender holds the GIL in its own calls, so short peaks inside them can be
+    missed.
+    """
+    samples = []
+    stop = threading.Event()
+
+    def sample() -> None:
+        while (memory := get_current_memory()) is not None:
+            samples.append(memory)
+            if stop.wait(MEMORY_SAMPLE_INTERVAL):
+                return
+
+    thread = threading.Thread(target=sample, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        memory = get_current_memory()
+        if memory is not None:
+            samples.append(memory)
+        measurement.peak = max(samples, default=None)
+
+
+@contextmanager
+def measure_peak_memory() -> Generator[MemoryMeasurement, None, None]:
+    """
+    Measure the peak resident memory of the block.
+
+    Yields:
+    - MemoryMeasurement: Its peak is set in bytes when the block ends, or None
+      if the platform does not report memory.
+    """
+    global measured_peak_memory  # noqa: PLW0603
+
+    measurement = MemoryMeasurement()
+    # Keep the peak before the stage for get_peak_memory
+    measured_peak_memory = max(measured_peak_memory, get_high_water_mark() or 0)
+    if reset_high_water_mark():
+        try:
+            yield measurement
+        finally:
+            measurement.peak = get_high_water_mark()
+    else:
+        with sample_peak_memory(measurement):
+            yield measurement
+
+    if measurement.peak is not None:
+        measured_peak_memory = max(measured_peak_memory, measurement.peak)
+
+
+def get_current_memory() -> int | None:
+    """Return the current resident memory of this process in bytes, or None."""
+    if sys.platform == "win32":
+        counters = get_memory_counters_windows()
+        return None if counters is None else counters.WorkingSetSize
+
+    try:
+        with open("/proc/self/statm") as f:  # noqa: PTH123
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        # Not available on macOS
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def get_memory_counters_windows() -> ctypes.Structure | None:
+    from ctypes import wintypes  # noqa: PLC0415
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    if not kernel32.K32GetProcessMemoryInfo(
+        kernel32.GetCurrentProcess(),
+        ctypes.byref(counters),
+        counters.cb,
+    ):
+        return None
+    return counters
+
+
+def get_shapekey_count(mesh: bpy.types.Mesh) -> int:
+    if mesh.shape_keys is None:
+        return 0
+    return max(len(mesh.shape_keys.key_blocks) - 1, 0)
+
+
+def estimate_mesh_memory(mesh: bpy.types.Mesh) -> int:
+    uv_count = len(mesh.uv_layers)
+    return (
+        len(mesh.vertices) * MESH_BYTES_PER_VERTEX
+        + len(mesh.edges) * MESH_BYTES_PER_EDGE
+        + len(mesh.loops) * (MESH_BYTES_PER_LOOP + uv_count * MESH_BYTES_PER_UV)
+        + len(mesh.polygons) * MESH_BYTES_PER_POLYGON
+        + len(mesh.vertices) * get_shapekey_count(mesh) * MESH_BYTES_PER_SHAPE_VERTEX
+    )
+
+
+def estimate_fbx_memory(mesh: bpy.types.Mesh) -> int:
+    uv_count = len(mesh.uv_layers)
+    return (
+        len(mesh.vertices) * FBX_BYTES_PER_VERTEX
+        + len(mesh.loops) * (FBX_BYTES_PER_LOOP + uv_count * FBX_BYTES_PER_UV)
+        + len(mesh.vertices) * get_shapekey_count(mesh) * FBX_BYTES_PER_SHAPE_VERTEX
+    )
+
+
+def get_export_meshes(objects: bpy.types.AnyType) -> set:
+    return {obj.data for obj in objects if obj.visible_get() and obj.type == "MESH"}
+
+
+def estimate_export_memory(
+    scene: bpy.types.Scene,
+    export_settings: bpy.types.AnyType,
+    *,
+    split_by_collection: bool,
+) -> int:
+    """
+    Estimate the memory an export needs in addition to the loaded scene.
+
+    Parameters:
+    - scene (bpy.types.Scene): The exported scene.
+    - export_settings (bpy.types.AnyType): Export settings
+    - split_by_collection (bool): If True, only the largest merge collection
+      is held by the FBX writer at a time.
+
+    Returns:
+    - int: Estimated bytes.
+    """
+    meshes = get_export_meshes(scene.objects)
+    processing = sum(estimate_mesh_memory(mesh) for mesh in meshes)
+
+    if split_by_collection:
+        writer = max(
+            (
+                sum(
+                    estimate_fbx_memory(mesh)
+                    for mesh in get_export_meshes(c.collection_ptr.all_objects)
+                )
+                for c in export_settings.collections
+                if c.collection_ptr
+            ),
+            default=0,
+        )
+    else:
+        writer = sum(estimate_fbx_memory(mesh) for mesh in meshes)
+
+    return processing + writer
+
+
+def get_memory_budget_error(
+    scene: bpy.types.Scene,
+    export_settings: bpy.types.AnyType,
+) -> str | None:
+    """Return the error message if the export is estimated to exceed the budget."""
+    budget = export_settings.memory_budget * GIB
+    if budget <= 0:
+        return None
+
+    split_by_collection = export_settings.split_by_collection
+    estimate = estimate_export_memory(
+        scene,
+        export_settings,
+        split_by_collection=split_by_collection,
+    )
+    if estimate <= budget:
+        return None
+
+    message = tip_(
+        "Estimated export memory %.1f GB exceeds the memory budget %.1f GB",
+    ) % (estimate / GIB, budget / GIB)
+    if not split_by_collection:
+        split_estimate = estimate_export_memory(
+            scene,
+            export_settings,
+            split_by_collection=True,
+        )
+        if split_estimate <= budget:
+            message += tip_(". With Split by Merge Collection it is %.1f GB") % (
+                split_estimate / GIB,
+            )
+    return message
+
+
+def purge_orphan_data() -> None:
+    """Free meshes and other data left without users by the previous stages."""
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
@@ -1,6 +1,8 @@
 import bpy
 import bpy_types
 
+from .core import call_operator
+
 
 def get_child_objects(collection: bpy.types.Collection) -> list:
     collections = [
@@ -13,15 +15,19 @@ def get_child_objects(collection: bpy.types.Collection) -> list:
     return collections
 
 
-def merge_objects(context: bpy_types.Context, collection: bpy.types.Collection) -> None:
+def merge_objects(
+    context: bpy_types.Context,
+    collection: bpy.types.Collection,
+) -> bpy.types.Object:
     merge_targets = get_child_objects(collection)
 
-    if len(merge_targets) == 1:
-        merge_targets[0].name = collection.name
-        context.view_layer.objects.active = merge_targets[0]
-    elif len(merge_targets) > 1:
-        context.view_layer.objects.active = merge_targets[0]
-        bpy.ops.object.select_all(action="DESELECT")
+    if len(merge_targets) == 0:
+        return None
+
+    merged_obj = merge_targets[0]
+    if len(merge_targets) > 1:
+        # Meshes of the joined objects are left without users
+        joined_meshes = [obj.data for obj in merge_targets[1:]]
 
         for obj in merge_targets:
             # Normalize Basis name
@@ -29,6 +35,20 @@ def merge_objects(context: bpy_types.Context, collection: bpy.types.Collection)
             if shapekeys is not None and len(shapekeys.key_blocks) > 0:
                 shapekeys.key_blocks[0].name = "Basis"
 
-            obj.select_set(state=True)
-        bpy.ops.object.join()
-        context.view_layer.objects.active.name = collection.name
+        call_operator(
+            bpy.ops.object.join,
+            override={
+                "active_object": merged_obj,
+                "object": merged_obj,
+                "selected_objects": merge_targets,
+                "selected_editable_objects": merge_targets,
+            },
+        )
+
+        for mesh in joined_meshes:
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+    merged_obj.name = collection.name
+    context.view_layer.objects.active = merged_obj
+    return merged_obj
@@ -1,4 +1,8 @@
 import bpy
+import numpy as np
+
+from .core import remove_object
+from .protocol import check_cancelled
 
 
 def copy_object(obj: bpy.types.Object) -> bpy.types.Object:
@@ -8,18 +12,19 @@ def copy_object(obj: bpy.types.Object) -> bpy.types.Object:
     return copy_obj
 
 
-def remove_object(obj: bpy.types.Object) -> None:
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.select_all(action="DESELECT")
-    obj.select_set(state=True)
-    bpy.ops.object.delete(use_global=False, confirm=False)
-
+def transfer_shapekey(
+    obj: bpy.types.Object,
+    blendshape: bpy.types.Object,
+    name: str,
+) -> None:
+    vertices = blendshape.data.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
 
-def transfer_shapekey(obj: bpy.types.Object, blendshape: bpy.types.Object) -> None:
-    bpy.ops.object.select_all(action="DESELECT")
-    blendshape.select_set(state=True)
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.join_shapes()
+    if obj.data.shape_keys is None:
+        obj.shape_key_add(name="Basis", from_mix=False)
+    shapekey = obj.shape_key_add(name=name, from_mix=False)
+    shapekey.data.foreach_set("co", co)
 
 
 def reset_shapekey_value(obj: bpy.types.Object) -> None:
@@ -37,17 +42,37 @@ def apply_shapekey(obj: bpy.types.Object, index: int) -> None:
 
 
 def apply_all_modifiers(obj: bpy.types.Object) -> None:
-    for m in obj.modifiers:
-        if m.show_viewport:
-            if m.type != "ARMATURE":
-                bpy.context.view_layer.objects.active = obj
-                try:
-                    bpy.ops.object.modifier_apply(modifier=m.name)
-                except RuntimeError:
-                    obj.modifiers.remove(m)
-        else:
+    for m in obj.modifiers[:]:
+        if not m.show_viewport:
             obj.modifiers.remove(m)
 
+    modifiers = [m for m in obj.modifiers if m.type != "ARMATURE"]
+    if len(modifiers) == 0:
+        return
+
+    # Evaluate the modifier stack without Armature modifiers
+    armature_modifiers = [m for m in obj.modifiers if m.type == "ARMATURE"]
+    for m in armature_modifiers:
+        m.show_viewport = False
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(
+        obj.evaluated_get(depsgraph),
+        preserve_all_data_layers=True,
+        depsgraph=depsgraph,
+    )
+
+    for m in armature_modifiers:
+        m.show_viewport = True
+
+    old_mesh = obj.data
+    obj.data = mesh
+    for m in modifiers:
+        obj.modifiers.remove(m)
+
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+
 
 def apply_modifiers_with_shapekeys(obj: bpy.types.Object) -> None:
     reset_shapekey_value(obj)
@@ -62,16 +87,15 @@ def apply_modifiers_with_shapekeys(obj: bpy.types.Object) -> None:
     basis_name = shapekeys_blocks[0].name
 
     for i in range(1, len(shapekeys_blocks)):
+        check_cancelled()
+
         blendshape_obj = copy_object(temp_obj)
 
         apply_shapekey(blendshape_obj, i)
         apply_all_modifiers(blendshape_obj)
 
         # Transfer shapekey to the original object
-        transfer_shapekey(obj, blendshape_obj)
-
-        # Rename shapekey
-        obj.data.shape_keys.key_blocks[i].name = shapekeys_blocks[i].name
+        transfer_shapekey(obj, blendshape_obj, shapekeys_blocks[i].name)
 
         # Delete the blendshape donor
         remove_object(blendshape_obj)
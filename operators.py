@@ -4,12 +4,18 @@ from typing import ClassVar
 import bpy
 import bpy_extras
 import bpy_types
-
-from .exporter import ExportError
-from .process import start_background_export, start_foreground_export
-from .shapekey import update_active_collection_shapekeys
+from bpy.app.translations import pgettext_tip as tip_
+
+from .backends import get_export_format_label
+from .jobs import add_job, cancel_all_jobs, get_job, has_running_jobs, remove_job
+from .protocol import ExportCancelledError
+from .shapekey_settings import (
+    apply_shapekey_rules,
+    compile_shapekey_rules,
+    update_active_collection_shapekeys,
+)
+from .tracker import get_changes, get_revision
 from .utils import update_active_setting_items, update_all_setting_items
-from .validator import ErrorCategory, validate
 
 
 def list_actions_move(items: bpy.types.AnyType, index: int, action: str) -> tuple:
@@ -149,23 +155,45 @@ class YFX_EXPORTER_OT_add_viewport_selection(bpy.types.Operator):
 class YFX_EXPORTER_OT_add_collection(bpy.types.Operator):
     bl_idname = "yfx_exporter.add_collection"
     bl_label = "Add Collection"
+    bl_property = "user_collections"
+
+    # There is a known bug with using a callback,
+    # Python must keep a reference to the strings returned by the callback
+    # or Blender will misbehave or even crash.
+    collection_list_enum_items: ClassVar[list] = []
+    collection_list_cache_key: ClassVar[tuple] = ()
+    collection_list_revision: ClassVar[int] = 0
 
     def get_collection_list_callback(
         self: bpy.types.Operator,
         context: bpy_types.Context,
     ) -> list:
+        cls = YFX_EXPORTER_OT_add_collection
         scn = context.scene
         export_settings = scn.yfx_exporter_settings.export_settings
-        custom_collections = [
+        custom_collections = {
             c.collection_ptr.name
             for c in export_settings.collections
             if c.collection_ptr
-        ]
-
-        # There is a known bug with using a callback,
-        # Python must keep a reference to the strings returned by the callback
-        # or Blender will misbehave or even crash.
-        YFX_EXPORTER_OT_add_collection.collection_list_enum_items = [
+        }
+
+        # Rebuild items only when collections or the configured list change.
+        # Renames are not always collection updates, so names are in the key
+        cache_key = (
+            scn.name_full,
+            tuple(c.name_full for c in bpy.data.collections),
+            frozenset(custom_collections),
+        )
+        changes = get_changes(cls.collection_list_revision)
+        if (
+            cache_key == cls.collection_list_cache_key
+            and not changes.full
+            and len(changes.collections) == 0
+        ):
+            return cls.collection_list_enum_items
+
+        scene_collections = dict.fromkeys(scn.collection.children_recursive)
+        cls.collection_list_enum_items = [
             (
                 c.name,
                 c.name + " ",  # Append a space to prevent translation
@@ -173,13 +201,22 @@ class YFX_EXPORTER_OT_add_collection(bpy.types.Operator):
                 "OUTLINER_COLLECTION",
                 idx,
             )
-            for idx, c in enumerate(bpy.data.collections)
-            if c.name not in custom_collections and bpy.context.scene.user_of_id(c)
+            for idx, c in enumerate(
+                sorted(scene_collections, key=lambda c: c.name),
+            )
+            if c.name not in custom_collections
         ]
-        return YFX_EXPORTER_OT_add_collection.collection_list_enum_items
+        cls.collection_list_cache_key = cache_key
+        cls.collection_list_revision = get_revision()
+        return cls.collection_list_enum_items
 
     user_collections: bpy.props.EnumProperty(items=get_collection_list_callback)
 
+    def invoke(self, context: bpy_types.Context, event: bpy.types.Event) -> set:
+        # Type-to-filter search instead of drawing every collection in a menu
+        context.window_manager.invoke_search_popup(self)
+        return {"RUNNING_MODAL"}
+
     def execute(self, context: bpy_types.Context) -> set:
         scn = context.scene
         settings = scn.yfx_exporter_settings.export_settings
@@ -190,7 +227,10 @@ class YFX_EXPORTER_OT_add_collection(bpy.types.Operator):
             self.report({"ERROR"}, message)
             return {"CANCELLED"}
 
-        if act_coll.name in [c.collection_ptr.name for c in settings.collections]:
+        custom_collections = {
+            c.collection_ptr.name for c in settings.collections if c.collection_ptr
+        }
+        if act_coll.name in custom_collections:
             info = '"%s" already in the list' % (act_coll.name)
         else:
             item = settings.collections.add()
@@ -213,8 +253,136 @@ class YFX_EXPORTER_OT_update_shapekey_list(bpy.types.Operator):
     bl_description = "Update shapekey list in collection"
     bl_options: ClassVar[set] = {"REGISTER"}
 
+    def execute(self, context: bpy_types.Context) -> set:
+        update_active_collection_shapekeys(context, force=True)
+        return {"FINISHED"}
+
+
+def get_active_shapekey_settings(context: bpy_types.Context) -> bpy.types.AnyType:
+    settings = context.scene.yfx_exporter_settings.export_settings
+    collections = settings.collections
+    if 0 <= settings.collection_index < len(collections):
+        return collections[settings.collection_index].shapekey_settings
+    return None
+
+
+class YFX_EXPORTER_OT_add_shapekey_rule(bpy.types.Operator):
+    """Add shapekey rule"""
+
+    bl_idname = "yfx_exporter.add_shapekey_rule"
+    bl_label = "Add Shapekey Rule"
+    bl_description = "Add a rule to configure shapekeys matching the pattern"
+    bl_options: ClassVar[set] = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        return get_active_shapekey_settings(context) is not None
+
+    def execute(self, context: bpy_types.Context) -> set:
+        shapekey_settings = get_active_shapekey_settings(context)
+        shapekey_settings.rules.add()
+        shapekey_settings.rule_index = len(shapekey_settings.rules) - 1
+        return {"FINISHED"}
+
+
+class YFX_EXPORTER_OT_remove_shapekey_rule(bpy.types.Operator):
+    """Remove shapekey rule"""
+
+    bl_idname = "yfx_exporter.remove_shapekey_rule"
+    bl_label = "Remove Shapekey Rule"
+    bl_description = "Remove the active shapekey rule"
+    bl_options: ClassVar[set] = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        shapekey_settings = get_active_shapekey_settings(context)
+        return shapekey_settings is not None and len(shapekey_settings.rules) > 0
+
+    def execute(self, context: bpy_types.Context) -> set:
+        shapekey_settings = get_active_shapekey_settings(context)
+        rules = shapekey_settings.rules
+        if 0 <= shapekey_settings.rule_index < len(rules):
+            rules.remove(shapekey_settings.rule_index)
+            shapekey_settings.rule_index = max(0, shapekey_settings.rule_index - 1)
+        return {"FINISHED"}
+
+
+def get_active_lod_settings(context: bpy_types.Context) -> bpy.types.AnyType:
+    settings = context.scene.yfx_exporter_settings.export_settings
+    collections = settings.collections
+    if 0 <= settings.collection_index < len(collections):
+        return collections[settings.collection_index].lod_settings
+    return None
+
+
+class YFX_EXPORTER_OT_add_lod_level(bpy.types.Operator):
+    """Add LOD level"""
+
+    bl_idname = "yfx_exporter.add_lod_level"
+    bl_label = "Add LOD Level"
+    bl_description = "Add a LOD level with half the ratio of the last level"
+    bl_options: ClassVar[set] = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        return get_active_lod_settings(context) is not None
+
+    def execute(self, context: bpy_types.Context) -> set:
+        lod_settings = get_active_lod_settings(context)
+        levels = lod_settings.levels
+        last_ratio = levels[-1].ratio if len(levels) > 0 else 1.0
+        level = levels.add()
+        level.ratio = max(last_ratio * 0.5, 0.001)
+        lod_settings.level_index = len(levels) - 1
+        return {"FINISHED"}
+
+
+class YFX_EXPORTER_OT_remove_lod_level(bpy.types.Operator):
+    """Remove LOD level"""
+
+    bl_idname = "yfx_exporter.remove_lod_level"
+    bl_label = "Remove LOD Level"
+    bl_description = "Remove the active LOD level"
+    bl_options: ClassVar[set] = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        lod_settings = get_active_lod_settings(context)
+        return lod_settings is not None and len(lod_settings.levels) > 0
+
+    def execute(self, context: bpy_types.Context) -> set:
+        lod_settings = get_active_lod_settings(context)
+        levels = lod_settings.levels
+        if 0 <= lod_settings.level_index < len(levels):
+            levels.remove(lod_settings.level_index)
+            lod_settings.level_index = max(0, lod_settings.level_index - 1)
+        return {"FINISHED"}
+
+
+class YFX_EXPORTER_OT_apply_shapekey_rules(bpy.types.Operator):
+    """Apply shapekey rules"""
+
+    bl_idname = "yfx_exporter.apply_shapekey_rules"
+    bl_label = "Apply Shapekey Rules"
+    bl_description = "Configure all shapekeys in the collection with the rules"
+    bl_options: ClassVar[set] = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        shapekey_settings = get_active_shapekey_settings(context)
+        return shapekey_settings is not None and len(shapekey_settings.rules) > 0
+
     def execute(self, context: bpy_types.Context) -> set:
         update_active_collection_shapekeys(context)
+
+        shapekey_settings = get_active_shapekey_settings(context)
+        rules = compile_shapekey_rules(shapekey_settings.rules)
+        count = sum(
+            apply_shapekey_rules(shapekey_setting, rules)
+            for shapekey_setting in shapekey_settings.shapekeys
+        )
+
+        self.report({"INFO"}, tip_("%d shapekeys configured") % count)
         return {"FINISHED"}
 
 
@@ -246,11 +414,22 @@ class YFX_EXPORTER_OT_export_fbx(bpy.types.Operator):
     bl_label = "Export FBX"
     bl_description = "Export FBX"
 
+    job_id = None
+    timer = None
+
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        return context.mode == "OBJECT"
+        return context.mode == "OBJECT" and not has_running_jobs()
 
     def execute(self, context: bpy.types.Context) -> set:
+        # The export engine is imported on first use to keep add-on startup fast
+        from .exporter import ExportError  # noqa: PLC0415
+        from .process import (  # noqa: PLC0415
+            start_background_export,
+            start_foreground_export,
+        )
+        from .validator import ErrorCategory, validate  # noqa: PLC0415
+
         scn = context.scene
         settings = scn.yfx_exporter_settings
         export_settings = settings.export_settings
@@ -265,17 +444,104 @@ class YFX_EXPORTER_OT_export_fbx(bpy.types.Operator):
                     exist_error = True
                 self.report({res.category.value}, res.message)
 
-        if not exist_error:
-            try:
-                if export_settings.use_main_process_export:
-                    start_foreground_export(context)
-                else:
-                    start_background_export(context)
-            except ExportError as e:
-                self.report({"ERROR"}, str(e))
+        if exist_error:
+            return {"FINISHED"}
+
+        # Settings may change while a background export runs
+        self.formats = get_export_format_label(export_settings)
+        try:
+            if export_settings.use_main_process_export:
+                changed = start_foreground_export(context)
             else:
-                self.report({"INFO"}, "FBX exported successfully!")
+                job = start_background_export(context)
+        except ExportError as e:
+            self.report({"ERROR"}, str(e))
+            return {"FINISHED"}
+
+        if export_settings.use_main_process_export:
+            self.report_success(changed=changed)
+            return {"FINISHED"}
+
+        # Wait for the background export without blocking the UI
+        self.job_id = add_job(job)
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event) -> set:
+        job = get_job(self.job_id)
+        if job is None:
+            # Removed by unregister
+            self.end_modal(context)
+            return {"CANCELLED"}
 
+        if event.type == "ESC":
+            job.cancel()
+            return {"RUNNING_MODAL"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        job.update()
+        context.window_manager.progress_update(int(job.progress * 100))
+        context.workspace.status_text_set(
+            tip_("YFX Exporter: %s %d%% (ESC to cancel)")
+            % (job.stage, job.progress * 100),
+        )
+        for area in context.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+        if job.is_running():
+            return {"PASS_THROUGH"}
+
+        self.end_modal(context)
+        return self.finish_job(job)
+
+    def end_modal(self, context: bpy.types.Context) -> None:
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        remove_job(self.job_id)
+
+    def finish_job(self, job: bpy.types.AnyType) -> set:
+        from .exporter import ExportError  # noqa: PLC0415
+
+        try:
+            job.finish()
+        except ExportCancelledError:
+            self.report({"WARNING"}, "Export cancelled")
+            return {"CANCELLED"}
+        except ExportError as e:
+            self.report({"ERROR"}, str(e))
+        else:
+            self.report_success(changed=job.changed)
+        return {"FINISHED"}
+
+    def report_success(self, *, changed: bool) -> None:
+        if changed:
+            self.report({"INFO"}, tip_("%s exported successfully!") % self.formats)
+        else:
+            self.report(
+                {"INFO"},
+                tip_("%s is unchanged. The existing files were kept") % self.formats,
+            )
+
+
+class YFX_EXPORTER_OT_cancel_export(bpy.types.Operator):
+    bl_idname = "yfx_exporter.cancel_export"
+    bl_label = "Cancel Export"
+    bl_description = "Cancel the running background export"
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:  # noqa: ARG003
+        return has_running_jobs()
+
+    def execute(self, context: bpy.types.Context) -> set:
+        cancel_all_jobs()
         return {"FINISHED"}
 
 
@@ -290,6 +556,8 @@ class YFX_EXPORTER_OT_check_model(bpy.types.Operator):
         return context.mode == "OBJECT"
 
     def execute(self, context: bpy.types.Context) -> set:
+        from .validator import validate  # noqa: PLC0415
+
         results = validate(context)
         if len(results) > 0:
             for res in results:
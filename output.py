@@ -0,0 +1,237 @@
+"""
+Atomic output of exported files.
+
+The exporter writes to a hidden partial file next to the destination. The
+partial file is moved into place only if its content differs from the existing
+file, so asset watchers never see half-written files or unchanged reimports.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+MANIFEST_NAME = ".yfx_manifest.json"
+
+FBX_BINARY_MAGIC = b"Kaydara FBX Binary  \x00"
+
+# Top-level FBX nodes that change on every export (creation time, file id)
+FBX_VOLATILE_NODES = {b"FBXHeaderExtension", b"FileId", b"CreationTime"}
+
+# Seconds to wait for another process updating the manifest
+MANIFEST_LOCK_TIMEOUT = 5.0
+
+
+def get_partial_path(path: str, *, keep_extension: bool = False) -> str:
+    """
+    Return the temp file written before the file is moved into place.
+
+    The name starts with a dot and, unless the extension must be kept, does
+    not end with it, so asset watchers matching *.fbx or *.glb ignore it.
+
+    Parameters:
+    - path (str): Destination file path.
+    - keep_extension (bool): For exporters that append their extension to
+      any other path. (e.g. ".char.partial.glb")
+    """
+    path = Path(path)
+    if keep_extension:
+        return str(path.with_name(f".{path.stem}.partial{path.suffix}"))
+    return str(path.with_name(f".{path.name}.partial"))
+
+
+def iter_fbx_hash_ranges(data: bytes) -> Generator[tuple[int, int], None, None]:
+    """
+    Yield byte ranges of a binary FBX file that are not volatile.
+
+    Parameters:
+    - data (bytes): Content of the FBX file.
+
+    Yields:
+    - tuple[int, int]: Start and end offsets.
+    """
+    if not data.startswith(FBX_BINARY_MAGIC):
+        yield 0, len(data)
+        return
+
+    header_size = len(FBX_BINARY_MAGIC) + 6
+    (version,) = struct.unpack_from("<I", data, header_size - 4)
+    record_header = struct.Struct("<QQQB" if version >= 7500 else "<IIIB")  # noqa: PLR2004
+
+    yield 0, header_size
+    offset = header_size
+    while offset + record_header.size <= len(data):
+        end_offset, _, _, name_length = record_header.unpack_from(data, offset)
+        if end_offset == 0:
+            # Null record terminating the top-level nodes
+            break
+        if end_offset <= offset or end_offset > len(data):
+            # Not a valid node. Hash the rest as is
+            break
+
+        name_offset = offset + record_header.size
+        name = data[name_offset : name_offset + name_length]
+        if name not in FBX_VOLATILE_NODES:
+            yield offset, end_offset
+        offset = end_offset
+
+    yield offset, len(data)
+
+
+def get_content_hash(path: str) -> str:
+    """Return the SHA-256 of the file ignoring volatile FBX header data."""
+    data = Path(path).read_bytes()
+    view = memoryview(data)
+    content_hash = hashlib.sha256()
+    for start, end in iter_fbx_hash_ranges(data):
+        content_hash.update(view[start:end])
+    return content_hash.hexdigest()
+
+
+def fsync_file(path: str) -> None:
+    with Path(path).open("rb+") as f:
+        os.fsync(f.fileno())
+
+
+def fsync_directory(directory: Path) -> None:
+    # Directories cannot be opened on Windows
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def manifest_lock(directory: Path) -> Generator[bool, None, None]:
+    """
+    Serialize manifest updates of parallel exports to the same directory.
+
+    Yields:
+    - bool: True if the lock was acquired. On timeout False is yielded and
+      the lock of the other writer is left untouched.
+    """
+    lock_path = directory / (MANIFEST_NAME + ".lock")
+    deadline = time.monotonic() + MANIFEST_LOCK_TIMEOUT
+    fd = None
+    while fd is None:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+
+    if fd is None:
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        os.close(fd)
+        lock_path.unlink(missing_ok=True)
+
+
+def load_manifest(directory: Path) -> dict:
+    try:
+        with (directory / MANIFEST_NAME).open(encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(directory: Path, manifest: dict) -> None:
+    # A unique temp file, so concurrent writers never replace each other's file
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory,
+        prefix=MANIFEST_NAME + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        Path(temp_path).replace(directory / MANIFEST_NAME)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def get_existing_hash(path: Path, entry: dict | None) -> str | None:
+    """Return the hash of the existing file, reusing the manifest if it is current."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    if (
+        entry is not None
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return entry.get("hash")
+    return get_content_hash(str(path))
+
+
+def commit_output(partial_path: str, path: str) -> bool:
+    """
+    Move the partial file into place if its content changed.
+
+    Parameters:
+    - partial_path (str): Completely written temp file in the same directory.
+    - path (str): Destination file path.
+
+    Returns:
+    - bool: True if the destination was replaced, False if it was unchanged.
+    """
+    destination = Path(path)
+    directory = destination.parent
+
+    # Hashing large files is done outside the lock
+    content_hash = get_content_hash(partial_path)
+    entry = load_manifest(directory).get(destination.name)
+
+    if get_existing_hash(destination, entry) == content_hash:
+        Path(partial_path).unlink()
+        changed = False
+    else:
+        fsync_file(partial_path)
+        Path(partial_path).replace(destination)
+        fsync_directory(directory)
+        changed = True
+
+    stat = destination.stat()
+    with manifest_lock(directory) as locked:
+        if not locked:
+            # The manifest is only a hash cache. Without an entry the next
+            # export hashes the existing file again. stdout carries protocol
+            # events in the background export, so warn on stderr
+            sys.stderr.write(
+                f"YFX Exporter: manifest is locked, {destination.name} not recorded\n",
+            )
+            return changed
+
+        manifest = load_manifest(directory)
+        manifest[destination.name] = {
+            "hash": content_hash,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "updated": datetime.fromtimestamp(
+                stat.st_mtime,
+                tz=timezone.utc,  # noqa: UP017 (Blender 4.0 bundles Python 3.10)
+            ).isoformat(),
+        }
+        save_manifest(directory, manifest)
+
+    return changed
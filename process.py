@@ -1,76 +1,239 @@
-import argparse
+import queue
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import IO
 
 import bpy
 
-from yfx_exporter.exporter import ExportError, export
+from .exporter import ExportError, export
+from .protocol import ExportCancelledError, parse_event_line
 
 
-def run_export_process(context: bpy.types.Context) -> None:
+def run_export_process(context: bpy.types.Context) -> bool:
     scn = context.scene
     settings = scn.yfx_exporter_settings
 
-    export(context, settings)
+    return export(context, settings)
 
 
-def start_foreground_export(context: bpy.types.Context) -> None:
-    run_export_process(context)
+def start_foreground_export(context: bpy.types.Context) -> bool:
+    """
+    Export in the current process.
 
+    Returns:
+    - bool: True if any output file was written, False if all were unchanged.
+    """
+    return run_export_process(context)
 
-def start_background_export(context: bpy.types.Context) -> None:
-    """Function to start background export"""
+
+def print_event(event: dict) -> None:
+    """Log stage timings to the console"""
+    if event["type"] == "stage_end":
+        message = f"YFX Exporter: {event['stage']} {event['elapsed']:.2f}s"
+        peak_memory = event.get("peak_memory")
+        if peak_memory is not None:
+            message += f", peak memory {peak_memory / 1024**3:.2f} GB"
+        memory = event.get("memory")
+        memory_delta = event.get("memory_delta")
+        if memory is not None and memory_delta is not None:
+            message += (
+                f", memory {memory / 1024**3:.2f} GB ({memory_delta / 1024**3:+.2f} GB)"
+            )
+        print(message)  # noqa: T201
+
+
+def read_stdout(stream: IO[str], events: queue.Queue) -> None:
+    for line in stream:
+        event = parse_event_line(line)
+        if event is None:
+            print(line, end="")  # noqa: T201
+        else:
+            events.put(event)
+
+
+def read_lines(stream: IO[str], lines: list) -> None:
+    lines.extend(stream)
+
+
+class BackgroundExportJob:
+    """Export running in a child Blender process"""
+
+    # Seconds to wait for a cooperative cancel before terminating the process
+    cancel_timeout = 5.0
+
+    def __init__(self, temp_dir: tempfile.TemporaryDirectory, export_path: str) -> None:
+        self.temp_dir = temp_dir
+        self.export_path = export_path
+        self.cancel_path = Path(temp_dir.name) / "cancel"
+
+        self.proc = None
+        self.events = queue.Queue()
+        self.stderr_lines = []
+        self.threads = []
+        self.errors = []
+        self.stage = ""
+        self.progress = 0.0
+        self.cancel_time = None
+        self.changed = False
+        self.partial_paths = []
+
+    def start(self, blender_args: list, cwd: str) -> None:
+        self.proc = subprocess.Popen(  # noqa: S603
+            blender_args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="UTF-8",
+            errors="replace",
+            cwd=cwd,
+        )
+        # Pipes are drained in threads so that the UI and the child never block
+        self.threads = [
+            threading.Thread(
+                target=read_stdout,
+                args=(self.proc.stdout, self.events),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=read_lines,
+                args=(self.proc.stderr, self.stderr_lines),
+                daemon=True,
+            ),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def is_running(self) -> bool:
+        return self.proc.poll() is None or any(t.is_alive() for t in self.threads)
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_time is not None
+
+    def update(self) -> list:
+        """
+        Process received events.
+
+        Returns:
+        - list: Events received since the last update.
+        """
+        events = []
+        while not self.events.empty():
+            event = self.events.get_nowait()
+            events.append(event)
+
+            if event["type"] == "stage_start":
+                self.stage = event["stage"]
+                self.progress = 0.0
+            elif event["type"] == "progress":
+                self.progress = event["fraction"]
+            elif event["type"] == "error":
+                self.errors.append(event["message"])
+            elif event["type"] == "output":
+                self.changed = self.changed or event["changed"]
+            elif event["type"] == "partial":
+                self.partial_paths.append(event["path"])
+            print_event(event)
+
+        # Terminate the child if it does not reach a checkpoint in time
+        if (
+            self.is_cancelled()
+            and self.proc.poll() is None
+            and time.monotonic() - self.cancel_time > self.cancel_timeout
+        ):
+            self.proc.terminate()
+        return events
+
+    def cancel(self) -> None:
+        if self.is_cancelled():
+            return
+        self.cancel_path.touch()
+        self.cancel_time = time.monotonic()
+
+    def kill(self) -> None:
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+        for thread in self.threads:
+            thread.join()
+        self.update()
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        # Only files announced by this export, other jobs may share the folder
+        for path in self.partial_paths:
+            Path(path).unlink(missing_ok=True)
+        self.temp_dir.cleanup()
+
+    def finish(self) -> None:
+        """
+        Wait for the child process to finish.
+
+        Raises:
+        - ExportCancelledError: The export was cancelled.
+        - ExportError: The child process failed.
+        """
+        try:
+            returncode = self.proc.wait()
+            for thread in self.threads:
+                thread.join()
+            self.update()
+
+            if self.is_cancelled():
+                raise ExportCancelledError
+
+            # Warnings in stderr do not fail the export
+            msg_stderr = "".join(self.stderr_lines)
+            if self.errors:
+                raise ExportError("\n".join(self.errors))
+            if returncode != 0:
+                msg = msg_stderr or f"Export process exited with code {returncode}"
+                raise ExportError(msg)
+            if msg_stderr:
+                sys.stderr.write(msg_stderr)
+        finally:
+            self.cleanup()
+
+
+def start_background_export(context: bpy.types.Context) -> BackgroundExportJob:
+    """
+    Function to start background export
+
+    The export runs without blocking. The returned job is polled with update()
+    and completed with finish().
+    """
     export_settings = context.scene.yfx_exporter_settings.export_settings
     abs_export_path = bpy.path.abspath(export_settings.export_path)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_file = str(Path(temp_dir) / "___yfx_exporter_temp___.blend")
+    temp_dir = tempfile.TemporaryDirectory()
+    job = BackgroundExportJob(temp_dir, abs_export_path)
+    try:
+        temp_file = str(Path(temp_dir.name) / "___yfx_exporter_temp___.blend")
         bpy.ops.wm.save_as_mainfile(filepath=temp_file, copy=True, check_existing=False)
 
-        exec_script_path = __file__
-        exec_script_dir = Path(exec_script_path).parent
+        # The worker registers only properties and the export engine
+        exec_script_dir = Path(__file__).parent
+        exec_script_path = str(exec_script_dir / "headless.py")
 
         blender_args = [
             bpy.app.binary_path,
             "--factory-startup",
-            "--addons",
-            __package__.split(".")[0],
             "--background",
             temp_file,
+            "--python-exit-code",
+            "1",
             "--python",
             exec_script_path,
             "--",
             "--output",
-            abs_export_path,
+            job.export_path,
+            "--cancel-file",
+            str(job.cancel_path),
         ]
-        with subprocess.Popen(
-            blender_args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="UTF-8",
-            cwd=str(exec_script_dir),
-        ) as proc:
-            print(proc.stdout.read())
-
-            # Check and raise ExportError if there is an error in stderr
-            msg_stderr = proc.stderr.read()
-            if msg_stderr:
-                raise ExportError(msg_stderr)
-
-
-if __name__ == "__main__":
-    """Entry point when the script is executed directly in sub process"""
-
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--output", type=str)
-
-    args = parser.parse_args(sys.argv[sys.argv.index("--") + 1 :])
-    output = args.output
-
-    context = bpy.context
-    settings = context.scene.yfx_exporter_settings
-    export_settings = settings.export_settings
-    export_settings.export_path = output
-    run_export_process(context)
+        job.start(blender_args, str(exec_script_dir))
+    except Exception:
+        temp_dir.cleanup()
+        raise
+    return job
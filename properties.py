@@ -32,11 +32,71 @@ class YFX_EXPORTER_PG_shapekey_settings(bpy.types.PropertyGroup):
     )
 
 
+class YFX_EXPORTER_PG_shapekey_rule(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(
+        name="Pattern",
+        description="Shapekey name pattern. '*' matches any characters",
+        default="*_LR",
+    )
+    separate_shapekey_left: bpy.props.StringProperty(
+        name="Left",
+        description="Name of the shapekey on the left. \
+'*' is replaced with the characters matched by the pattern",
+        default="*_L",
+    )
+    separate_shapekey_right: bpy.props.StringProperty(
+        name="Right",
+        description="Name of the shapekey on the right. \
+'*' is replaced with the characters matched by the pattern",
+        default="*_R",
+    )
+    delete_shapekey: bpy.props.BoolProperty(
+        name="Delete Source Shapekey",
+        description="Deletes the source shapekey used for splitting",
+        default=True,
+    )
+
+
 class YFX_EXPORTER_PG_collection_shapekey_settings(bpy.types.PropertyGroup):
     shapekeys: bpy.props.CollectionProperty(
         type=YFX_EXPORTER_PG_shapekey_settings,
     )
     shapekey_index: bpy.props.IntProperty()
+    rules: bpy.props.CollectionProperty(
+        type=YFX_EXPORTER_PG_shapekey_rule,
+    )
+    rule_index: bpy.props.IntProperty()
+    compact_shapekeys: bpy.props.BoolProperty(
+        name="Compact Shapekeys",
+        description="Snap small shapekey offsets to zero so that unchanged vertices \
+are not written to the file",
+        default=False,
+    )
+    delta_threshold: bpy.props.FloatProperty(
+        name="Threshold",
+        description="Offsets shorter than this distance are snapped to zero",
+        default=0.0001,
+        min=0.0,
+        soft_max=0.01,
+        precision=5,
+        step=0.001,
+        subtype="DISTANCE",
+    )
+    quantize_deltas: bpy.props.BoolProperty(
+        name="Quantize",
+        description="Round shapekey offsets to a grid",
+        default=False,
+    )
+    quantize_step: bpy.props.FloatProperty(
+        name="Grid Size",
+        description="Grid size of quantized offsets",
+        default=0.0001,
+        min=0.000001,
+        soft_max=0.01,
+        precision=6,
+        step=0.001,
+        subtype="DISTANCE",
+    )
 
 
 class YFX_EXPORTER_PG_transform_settings(bpy.types.PropertyGroup):
@@ -53,6 +113,106 @@ class YFX_EXPORTER_PG_vertex_group_settings(bpy.types.PropertyGroup):
         description="Deletes vertex groups not assigned to deform bones",
         default=True,
     )
+    limit_influences: bpy.props.BoolProperty(
+        name="Limit Bone Influences",
+        description="Keep only the largest deform weights of each vertex",
+        default=False,
+    )
+    max_influences: bpy.props.IntProperty(
+        name="Max Influences",
+        description="Maximum number of deform bones per vertex",
+        default=4,
+        min=1,
+        soft_max=8,
+    )
+    normalize_weights: bpy.props.BoolProperty(
+        name="Normalize",
+        description="Scale deform weights of each vertex to sum to 1",
+        default=True,
+    )
+    quantize_weights: bpy.props.BoolProperty(
+        name="Quantize to 8 bits",
+        description="Round normalized weights to multiples of 1/255 keeping \
+their sum at 1",
+        default=True,
+    )
+
+
+class YFX_EXPORTER_PG_weld_settings(bpy.types.PropertyGroup):
+    weld_vertices: bpy.props.BoolProperty(
+        name="Weld Vertices",
+        description="Merge vertices that coincide in the basis and all shapekeys \
+after merging",
+        default=False,
+    )
+    merge_distance: bpy.props.FloatProperty(
+        name="Merge Distance",
+        description="Merge vertices closer than this in the basis and all shapekeys",
+        default=0.0001,
+        min=0.000001,
+        soft_max=0.01,
+        precision=6,
+        step=0.001,
+        subtype="DISTANCE",
+    )
+    boundary_only: bpy.props.BoolProperty(
+        name="Boundary Only",
+        description="Only merge vertices on open boundaries, such as seams \
+between merged parts",
+        default=True,
+    )
+
+
+class YFX_EXPORTER_PG_material_settings(bpy.types.PropertyGroup):
+    merge_material_slots: bpy.props.BoolProperty(
+        name="Merge Material Slots",
+        description="Merge slots with the same material and remove unused slots \
+to reduce draw calls",
+        default=False,
+    )
+    group_by_atlas: bpy.props.BoolProperty(
+        name="Group by Atlas",
+        description="Merge slots of materials that have the same atlas key",
+        default=False,
+    )
+    atlas_key: bpy.props.StringProperty(
+        name="Atlas Key",
+        description="Custom property of materials that names their texture atlas",
+        default="atlas",
+    )
+
+
+class YFX_EXPORTER_PG_lod_level(bpy.types.PropertyGroup):
+    ratio: bpy.props.FloatProperty(
+        name="Ratio",
+        description="Ratio of faces to keep, relative to the merged mesh",
+        default=0.5,
+        min=0.001,
+        max=1.0,
+        subtype="FACTOR",
+    )
+
+
+class YFX_EXPORTER_PG_lod_settings(bpy.types.PropertyGroup):
+    generate_lod: bpy.props.BoolProperty(
+        name="Generate LOD",
+        description="Generate decimated copies of the merged object \
+named {name}_LOD{n}",
+        default=False,
+    )
+    levels: bpy.props.CollectionProperty(type=YFX_EXPORTER_PG_lod_level)
+    level_index: bpy.props.IntProperty()
+    preserve_shapekeys: bpy.props.BoolProperty(
+        name="Preserve Shapekeys",
+        description="Transfer shapekeys of the merged object to each LOD",
+        default=True,
+    )
+    preserve_uv_seams: bpy.props.BoolProperty(
+        name="Preserve UV Seams",
+        description="Prefer keeping vertices on UV seams and UV island boundaries. \
+They can still be collapsed at low ratios",
+        default=True,
+    )
 
 
 class YFX_EXPORTER_PG_collection_settings(bpy.types.PropertyGroup):
@@ -71,6 +231,11 @@ class YFX_EXPORTER_PG_collection_settings(bpy.types.PropertyGroup):
     vertex_group_settings: bpy.props.PointerProperty(
         type=YFX_EXPORTER_PG_vertex_group_settings,
     )
+    weld_settings: bpy.props.PointerProperty(type=YFX_EXPORTER_PG_weld_settings)
+    material_settings: bpy.props.PointerProperty(
+        type=YFX_EXPORTER_PG_material_settings,
+    )
+    lod_settings: bpy.props.PointerProperty(type=YFX_EXPORTER_PG_lod_settings)
 
 
 @orientation_helper(axis_forward="-Z", axis_up="Y")
@@ -383,14 +548,223 @@ class YFX_EXPORTER_PG_fbx_export_settings(bpy.types.PropertyGroup):
     )
 
 
+class YFX_EXPORTER_PG_gltf_export_settings(bpy.types.PropertyGroup):
+    """@see https://github.com/KhronosGroup/glTF-Blender-IO/blob/main/addons/io_scene_gltf2/__init__.py"""
+
+    export_format: bpy.props.EnumProperty(  # Not configurable
+        name="Format",
+        items=(
+            (
+                "GLB",
+                "glTF Binary (.glb)",
+                "Exports a single file, with all data packed in binary form",
+            ),
+        ),
+        default="GLB",
+    )
+    use_visible: bpy.props.BoolProperty(  # Not configurable
+        name="Visible Objects",
+        description="Export visible objects only",
+        default=True,
+    )
+    export_apply: bpy.props.BoolProperty(  # Not configurable
+        name="Apply Modifiers",
+        description="Apply modifiers (excluding Armatures) to mesh objects",
+        default=False,
+    )
+    export_yup: bpy.props.BoolProperty(
+        name="+Y Up",
+        description="Export using glTF convention, +Y up",
+        default=True,
+    )
+    export_texcoords: bpy.props.BoolProperty(
+        name="UVs",
+        description="Export UVs (texture coordinates) with meshes",
+        default=True,
+    )
+    export_normals: bpy.props.BoolProperty(
+        name="Normals",
+        description="Export vertex normals with meshes",
+        default=True,
+    )
+    export_tangents: bpy.props.BoolProperty(
+        name="Tangents",
+        description="Export vertex tangents with meshes",
+        default=False,
+    )
+    export_materials: bpy.props.EnumProperty(
+        name="Materials",
+        items=(
+            ("EXPORT", "Export", "Export all materials used by included objects"),
+            (
+                "PLACEHOLDER",
+                "Placeholder",
+                "Do not export materials, but write multiple primitive groups per mesh, \
+keeping material slot information",
+            ),
+            (
+                "NONE",
+                "No export",
+                "Do not export materials, and combine mesh primitive groups, \
+losing material slot information",
+            ),
+        ),
+        description="Export materials",
+        default="EXPORT",
+    )
+    export_image_format: bpy.props.EnumProperty(
+        name="Images",
+        items=(
+            (
+                "AUTO",
+                "Automatic",
+                "Save PNGs as PNGs, JPEGs as JPEGs, WebPs as WebPs. \
+If neither one, use PNG",
+            ),
+            (
+                "JPEG",
+                "JPEG Format (.jpg)",
+                "Save images as JPEGs. (Images that need alpha are saved as PNGs \
+though.) Be aware of a possible loss in quality",
+            ),
+            ("NONE", "None", "Don't export images"),
+        ),
+        description="Output format for images",
+        default="AUTO",
+    )
+    export_morph: bpy.props.BoolProperty(
+        name="Shape Keys",
+        description="Export shape keys (morph targets)",
+        default=True,
+    )
+    export_morph_normal: bpy.props.BoolProperty(
+        name="Shape Key Normals",
+        description="Export vertex normals with shape keys (morph targets)",
+        default=True,
+    )
+    export_skins: bpy.props.BoolProperty(
+        name="Skinning",
+        description="Export skinning (armature) data",
+        default=True,
+    )
+    export_def_bones: bpy.props.BoolProperty(
+        name="Export Deformation Bones Only",
+        description="Export Deformation bones only",
+        default=False,
+    )
+    export_animations: bpy.props.BoolProperty(
+        name="Animations",
+        description="Exports active actions and NLA tracks as glTF animations",
+        default=True,
+    )
+    export_draco_mesh_compression_enable: bpy.props.BoolProperty(
+        name="Draco mesh compression",
+        description="Compress mesh using Draco",
+        default=False,
+    )
+    export_draco_mesh_compression_level: bpy.props.IntProperty(
+        name="Compression level",
+        description="Compression level (0 = most speed, 6 = most compression, \
+higher values currently not supported)",
+        default=6,
+        min=0,
+        max=10,
+    )
+    export_draco_position_quantization: bpy.props.IntProperty(
+        name="Position quantization bits",
+        description="Quantization bits for position values (0 = no quantization)",
+        default=14,
+        min=0,
+        max=30,
+    )
+    export_draco_normal_quantization: bpy.props.IntProperty(
+        name="Normal quantization bits",
+        description="Quantization bits for normal values (0 = no quantization)",
+        default=10,
+        min=0,
+        max=30,
+    )
+    export_draco_texcoord_quantization: bpy.props.IntProperty(
+        name="Texcoord quantization bits",
+        description="Quantization bits for texture coordinate values \
+(0 = no quantization)",
+        default=12,
+        min=0,
+        max=30,
+    )
+    export_draco_color_quantization: bpy.props.IntProperty(
+        name="Color quantization bits",
+        description="Quantization bits for color values (0 = no quantization)",
+        default=10,
+        min=0,
+        max=30,
+    )
+    export_draco_generic_quantization: bpy.props.IntProperty(
+        name="Generic quantization bits",
+        description="Quantization bits for generic values like weights or joints \
+(0 = no quantization)",
+        default=12,
+        min=0,
+        max=30,
+    )
+
+
 class YFX_EXPORTER_PG_export_settings(bpy.types.PropertyGroup):
     collections: bpy.props.CollectionProperty(type=YFX_EXPORTER_PG_collection_settings)
     collection_index: bpy.props.IntProperty(update=update_active_setting_items)
     fbx_export_settings: bpy.props.PointerProperty(
         type=YFX_EXPORTER_PG_fbx_export_settings,
     )
+    gltf_export_settings: bpy.props.PointerProperty(
+        type=YFX_EXPORTER_PG_gltf_export_settings,
+    )
+    export_formats: bpy.props.EnumProperty(
+        name="Export Formats",
+        description="File formats written from the same preprocessed scene",
+        items=(
+            ("FBX", "FBX", "Export FBX to the export path"),
+            ("GLTF", "GLB", "Export glTF Binary next to the export path"),
+        ),
+        options={"ENUM_FLAG"},
+        default={"FBX"},
+    )
     export_path: bpy.props.StringProperty()
+    lod_output: bpy.props.EnumProperty(
+        name="LOD Output",
+        items=(
+            ("SAME_FILE", "Same File", "Write LOD objects into the same file"),
+            (
+                "SEPARATE_FILES",
+                "Separate Files",
+                "Write each LOD level to its own file named {export file name}_LOD{n}",
+            ),
+        ),
+        default="SAME_FILE",
+    )
+    split_by_collection: bpy.props.BoolProperty(
+        name="Split by Merge Collection",
+        description="Write each merge collection and its armature to its own file \
+named {export file name}_{collection name}",
+        default=False,
+    )
     temp_path: bpy.props.StringProperty(subtype="DIR_PATH")
+    limit_to_merge_collections: bpy.props.BoolProperty(
+        name="Limit to Merge Collections",
+        description="Only realize, localize and apply modifiers to objects in merge \
+collections and the objects they depend on. Other objects are exported as they are",
+        default=False,
+    )
+    memory_budget: bpy.props.FloatProperty(
+        name="Memory Budget (GB)",
+        description="Memory the export may use in addition to the loaded scene. \
+The export fails early if its estimate exceeds the budget. Unused data is freed \
+between merge collections only in background exports, main process exports keep \
+it. 0 means no limit",
+        default=0.0,
+        min=0.0,
+        soft_max=128.0,
+        precision=1,
+    )
     use_main_process_export: bpy.props.BoolProperty(
         name="(Warning!)Main Process Export",
         description="(Warning!)When enabling this option, the export process in the \
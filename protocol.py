@@ -0,0 +1,120 @@
+"""
+Line-delimited JSON protocol between the export child process and its parent.
+
+The child writes one event per stdout line with EVENT_PREFIX. Other lines
+(e.g. print output of Blender or other add-ons) are plain log text.
+
+Events:
+- stage_start: {"stage"}
+- stage_end: {"stage", "elapsed", "peak_memory", "memory", "memory_delta"}
+- progress: {"stage", "fraction"}
+- timing: {"name", "seconds"}
+- validation: {"code", "category", "message"}
+- error: {"message"}
+- partial: {"path"}
+- cancelled: {}
+- stats: any numeric values
+
+The parent cancels the export by creating the cancel file. The child checks it
+at each checkpoint and stops with ExportCancelledError.
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .memory import get_current_memory, measure_peak_memory
+
+EVENT_PREFIX = "@yfx "
+
+# Function receiving emitted events. Events are dropped when None.
+listener = None
+
+# File whose existence requests cancellation. Never cancelled when None.
+cancel_path = None
+
+
+class ExportCancelledError(Exception):
+    pass
+
+
+def set_listener(func: Callable | None) -> None:
+    global listener  # noqa: PLW0603
+    listener = func
+
+
+def write_event_line(event: dict) -> None:
+    """Listener for the child process to send events to the parent."""
+    sys.stdout.write(EVENT_PREFIX + json.dumps(event, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def set_cancel_path(path: Path | None) -> None:
+    global cancel_path  # noqa: PLW0603
+    cancel_path = path
+
+
+def check_cancelled() -> None:
+    """Checkpoint of cooperative cancellation."""
+    if cancel_path is not None and cancel_path.exists():
+        raise ExportCancelledError
+
+
+def emit(event_type: str, **data: object) -> None:
+    if listener is None:
+        return
+    listener({"type": event_type, **data})
+
+
+def report_progress(stage: str, fraction: float) -> None:
+    emit("progress", stage=stage, fraction=min(max(fraction, 0.0), 1.0))
+
+
+@contextmanager
+def report_stage(stage: str) -> Generator[None, None, None]:
+    """
+    Emit stage_start and stage_end events around the block.
+
+    stage_end has the peak resident memory during the stage, the resident
+    memory at its end and the change during the stage. Each is None if the
+    platform does not report it.
+    """
+    check_cancelled()
+    emit("stage_start", stage=stage)
+    start = time.perf_counter()
+    start_memory = get_current_memory()
+    with measure_peak_memory() as measurement:
+        yield
+    memory = get_current_memory()
+    emit(
+        "stage_end",
+        stage=stage,
+        elapsed=time.perf_counter() - start,
+        peak_memory=measurement.peak,
+        memory=memory,
+        memory_delta=None if memory is None else memory - start_memory,
+    )
+
+
+def parse_event_line(line: str) -> dict | None:
+    """
+    Parse a line written by the child process.
+
+    Parameters:
+    - line (str): A line of the child stdout.
+
+    Returns:
+    - dict | None: The event, or None if the line is not a protocol event.
+    """
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        event = json.loads(line[len(EVENT_PREFIX) :])
+    except ValueError:
+        return None
+    if not isinstance(event, dict) or "type" not in event:
+        return None
+    return event
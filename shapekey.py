@@ -1,23 +1,82 @@
+from itertools import chain
+
 import bpy
+import numpy as np
 
-from .merge import get_child_objects
+from .protocol import check_cancelled
 
 
-def insert_shapekey(obj: bpy.types.Object, name: str, index: int) -> bpy.types.ShapeKey:
-    key_blocks_len = len(obj.data.shape_keys.key_blocks)
-    if key_blocks_len <= 1:
-        return None
+def get_shapekey_co(shapekey: bpy.types.ShapeKey) -> np.ndarray:
+    co = np.empty(len(shapekey.data) * 3, dtype=np.float32)
+    shapekey.data.foreach_get("co", co)
+    return co.reshape(-1, 3)
 
-    shapekey = obj.shape_key_add(name=name, from_mix=False)
+
+def copy_shapekey_settings(
+    source: bpy.types.ShapeKey,
+    target: bpy.types.ShapeKey,
+) -> None:
+    target.slider_min = source.slider_min
+    target.slider_max = source.slider_max
+    target.value = source.value
+    target.vertex_group = source.vertex_group
+    target.interpolation = source.interpolation
+    target.mute = source.mute
+
+
+def move_shapekeys(obj: bpy.types.Object, order: list) -> None:
+    """
+    Reorder shapekeys with the data API.
+
+    Shapekeys after the first position that differs from the order are
+    re-added at the bottom one by one, so only one shapekey is copied at a time.
+
+    Parameters:
+    - obj (bpy.types.Object): The target object.
+    - order (list): Names of the shapekeys except Basis.
+                    Shapekeys not included in the order are removed.
+    """
+    key_blocks = obj.data.shape_keys.key_blocks
+    current = [key.name for key in key_blocks[1:]]
+
+    prefix = 0
+    while prefix < min(len(current), len(order)) and current[prefix] == order[prefix]:
+        prefix += 1
+    if prefix == len(current) == len(order):
+        return
 
     stash_active_index = obj.active_shape_key_index
-    obj.active_shape_key_index = key_blocks_len
+    relative_keys = {key.name: key.relative_key.name for key in key_blocks}
+
+    for name in order[prefix:]:
+        source = key_blocks[name]
+        co = get_shapekey_co(source).ravel()
+
+        shapekey = obj.shape_key_add(name=name, from_mix=False)
+        shapekey.data.foreach_set("co", co)
+        copy_shapekey_settings(source, shapekey)
+
+        obj.shape_key_remove(source)
+        shapekey.name = name
 
-    for _ in range(key_blocks_len - index - 1):
-        bpy.ops.object.shape_key_move(type="UP")
-    obj.active_shape_key_index = stash_active_index
+    for name in set(current[prefix:]).difference(order):
+        obj.shape_key_remove(key_blocks[name])
 
-    return shapekey
+    for key in key_blocks[1:]:
+        relative_key = key_blocks.get(relative_keys.get(key.name, ""))
+        key.relative_key = relative_key or key_blocks[0]
+
+    obj.active_shape_key_index = min(stash_active_index, len(key_blocks) - 1)
+
+
+def add_separated_shapekey(
+    obj: bpy.types.Object,
+    name: str,
+    co: np.ndarray,
+) -> str:
+    shapekey = obj.shape_key_add(name=name, from_mix=False)
+    shapekey.data.foreach_set("co", co.ravel())
+    return shapekey.name
 
 
 def separate_shapekey(
@@ -26,38 +85,61 @@ def separate_shapekey(
     left: str,
     right: str,
     eps: float = 0.0000001,
-) -> None:
+) -> list:
+    """
+    Split the source shapekey along the X axis passing through the object's origin.
+
+    The separated shapekeys are added at the bottom.
+
+    Returns:
+    - list: Names of the added shapekeys. (left, right)
+    """
     key_blocks = obj.data.shape_keys.key_blocks
 
-    source_shapekey_idx = key_blocks.find(source)
-    if source_shapekey_idx < 0:
-        return
-    source_shapekey = key_blocks[source_shapekey_idx]
-    right_shapekey = (
-        insert_shapekey(obj, right, source_shapekey_idx) if right else None
-    )  # No error check
-    left_shapekey = (
-        insert_shapekey(obj, left, source_shapekey_idx) if left else None
-    )  # No error check
-    basis_shapekey = key_blocks[0]
-
-    for i in range(len(source_shapekey.data)):
-        co = source_shapekey.data[i].co
-
-        if co.x > eps:
-            if left_shapekey:
-                left_shapekey.data[i].co = co
-        elif co.x < -eps:
-            if right_shapekey:
-                right_shapekey.data[i].co = co
-        else:
-            basis_co = basis_shapekey.data[i].co
-            center_co = basis_co + ((co - basis_co) / 2)
-            if left_shapekey:
-                left_shapekey.data[i].co = center_co
-
-            if right_shapekey:
-                right_shapekey.data[i].co = center_co
+    source_shapekey = key_blocks.get(source)
+    if source_shapekey is None:
+        return []
+
+    source_co = get_shapekey_co(source_shapekey)
+    basis_co = get_shapekey_co(key_blocks[0])
+    center_co = basis_co + ((source_co - basis_co) / 2)
+
+    x = source_co[:, 0]
+    is_left = x > eps
+    is_right = x < -eps
+    is_center = ~(is_left | is_right)
+
+    names = []
+    if left:
+        left_co = basis_co.copy()
+        left_co[is_left] = source_co[is_left]
+        left_co[is_center] = center_co[is_center]
+        names.append(add_separated_shapekey(obj, left, left_co))
+
+    if right:
+        right_co = basis_co.copy()
+        right_co[is_right] = source_co[is_right]
+        right_co[is_center] = center_co[is_center]
+        names.append(add_separated_shapekey(obj, right, right_co))
+
+    return names
+
+
+def get_separated_order(
+    key_blocks: bpy.types.AnyType,
+    separated: dict,
+    deleted: set,
+) -> list:
+    # Place the separated shapekeys just below the source shapekey
+    added = set(chain.from_iterable(separated.values()))
+    order = []
+    for key in key_blocks[1:]:
+        if key.name in added:
+            continue
+        if key.name not in deleted:
+            order.append(key.name)
+        order.extend(separated.get(key.name, []))
+    return order
 
 
 def separate_shapekey_lr(
@@ -69,17 +151,28 @@ def separate_shapekey_lr(
         return
 
     key_blocks = shapekeys.key_blocks
+    separated = {}  # key: source name, value: names of separated shapekeys
+    deleted = set()
     for shapekey_setting in shapekey_settings.shapekeys:
         if shapekey_setting.separate_shapekey:
+            check_cancelled()
             idx = key_blocks.find(shapekey_setting.name)
             left = shapekey_setting.separate_shapekey_left
             right = shapekey_setting.separate_shapekey_right
             if idx > 0:
                 if left or right:
-                    separate_shapekey(obj, shapekey_setting.name, left, right)
+                    separated[shapekey_setting.name] = separate_shapekey(
+                        obj,
+                        shapekey_setting.name,
+                        left,
+                        right,
+                    )
 
                 if shapekey_setting.delete_shapekey:
-                    obj.shape_key_remove(key_blocks[idx])
+                    deleted.add(shapekey_setting.name)
+
+    if len(separated) > 0 or len(deleted) > 0:
+        move_shapekeys(obj, get_separated_order(key_blocks, separated, deleted))
 
 
 def sort_shapekey(obj: bpy.types.Object, shapekey_settings: bpy.types.AnyType) -> None:
@@ -87,67 +180,16 @@ def sort_shapekey(obj: bpy.types.Object, shapekey_settings: bpy.types.AnyType) -
     if shapekeys is None or len(shapekeys.key_blocks) <= 1:
         return
 
-    stash_active_index = obj.active_shape_key_index
+    # Shapekeys in the settings are moved to the bottom in the settings order
     key_blocks = shapekeys.key_blocks
-    for shapekey_setting in shapekey_settings.shapekeys:
-        idx = key_blocks.find(shapekey_setting.name)
-        if idx < 0:
-            continue
-        obj.active_shape_key_index = idx
-        bpy.ops.object.shape_key_move(type="BOTTOM")
-
-    obj.active_shape_key_index = stash_active_index
-
-
-def get_collection_shapekeys(collection: bpy.types.Collection) -> list:
-    objects = get_child_objects(collection)
-    total_shapekeys = []
-    for obj in objects:
-        shapekeys = obj.data.shape_keys
-        if shapekeys is not None and len(shapekeys.key_blocks) > 1:
-            shapekey_names = [key.name for key in shapekeys.key_blocks]
-            total_shapekeys.extend(shapekey_names[1:])
-
-    return list(dict.fromkeys(total_shapekeys))
-
-
-def update_collection_shepekey_settings(collection_setting: bpy.types.AnyType) -> None:
-    shapekey_settings = collection_setting.shapekey_settings
-    shapekeys = shapekey_settings.shapekeys
-
-    # Add new shapekeys
-    shapekey_names = get_collection_shapekeys(collection_setting.collection_ptr)
-    for name in shapekey_names:
-        if shapekeys.find(name) < 0:
-            shapekey_item = shapekeys.add()
-            shapekey_item.name = name
-
-    # Remove deleted shapekeys
-    remove_idx = [
-        i for i, shapekey in enumerate(shapekeys) if shapekey.name not in shapekey_names
-    ]
-    for i in reversed(remove_idx):
-        shapekeys.remove(i)
-
-
-def update_active_collection_shapekeys(context: bpy.types.Context) -> None:
-    if context and context.scene.yfx_exporter_settings:
-        export_settings = context.scene.yfx_exporter_settings.export_settings
-        collection_settings = export_settings.collections
-        collection_index = export_settings.collection_index
-        len_collections = len(collection_settings)
-
-        if len_collections > 0 and 0 <= collection_index < len_collections:
-            collection_setting = collection_settings[collection_index]
-            update_collection_shepekey_settings(collection_setting)
-
-
-def update_all_collection_shapekeys(context: bpy.types.Context) -> None:
-    if context and context.scene.yfx_exporter_settings:
-        export_settings = context.scene.yfx_exporter_settings.export_settings
-        collection_settings = export_settings.collections
-        len_collections = len(collection_settings)
-
-        for i in range(len_collections):
-            collection_setting = collection_settings[i]
-            update_collection_shepekey_settings(collection_setting)
+    names = [key.name for key in key_blocks[1:]]
+    sorted_names = dict.fromkeys(
+        shapekey_setting.name
+        for shapekey_setting in shapekey_settings.shapekeys
+        if shapekey_setting.name in key_blocks
+        and shapekey_setting.name != key_blocks[0].name
+    )
+    order = [name for name in names if name not in sorted_names]
+    order.extend(sorted_names)
+
+    move_shapekeys(obj, order)
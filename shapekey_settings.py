@@ -0,0 +1,209 @@
+import re
+from dataclasses import dataclass
+from itertools import chain
+
+import bpy
+
+from .merge import get_child_objects
+from .tracker import get_changes, get_revision, reset_callbacks
+
+
+def compile_shapekey_rules(rules: bpy.types.AnyType) -> list:
+    """
+    Compile shapekey rules to regular expressions.
+
+    Parameters:
+    - rules (bpy.types.AnyType): Collection of YFX_EXPORTER_PG_shapekey_rule.
+
+    Returns:
+    - list: Pairs of (compiled pattern, rule).
+    """
+    return [
+        (
+            re.compile("(.*)".join(re.escape(part) for part in rule.name.split("*"))),
+            rule,
+        )
+        for rule in rules
+        if rule.name
+    ]
+
+
+def expand_rule_name(template: str, groups: tuple) -> str:
+    """Replace each '*' in the template with the characters matched by the rule."""
+    parts = template.split("*")
+    expanded = [parts[0]]
+    for i, part in enumerate(parts[1:]):
+        expanded.append(groups[i] if i < len(groups) else "")
+        expanded.append(part)
+    return "".join(expanded)
+
+
+def apply_shapekey_rules(shapekey_setting: bpy.types.AnyType, rules: list) -> bool:
+    """
+    Configure a shapekey setting with the first matching rule.
+
+    Parameters:
+    - shapekey_setting (bpy.types.AnyType): YFX_EXPORTER_PG_shapekey_settings
+    - rules (list): Compiled rules. (see compile_shapekey_rules)
+
+    Returns:
+    - bool: True if a rule is applied.
+    """
+    for pattern, rule in rules:
+        match = pattern.fullmatch(shapekey_setting.name)
+        if match is None:
+            continue
+
+        groups = match.groups()
+        shapekey_setting.separate_shapekey = True
+        shapekey_setting.separate_shapekey_left = expand_rule_name(
+            rule.separate_shapekey_left,
+            groups,
+        )
+        shapekey_setting.separate_shapekey_right = expand_rule_name(
+            rule.separate_shapekey_right,
+            groups,
+        )
+        shapekey_setting.delete_shapekey = rule.delete_shapekey
+        return True
+
+    return False
+
+
+# Last synchronized state of each collection setting.
+# key: (scene name, collection name)
+collection_shapekey_signatures = {}
+
+
+@dataclass
+class ShapekeySyncState:
+    signature: int
+    settings_count: int
+    revision: int
+    objects: set
+    shape_keys: set
+
+
+def get_object_shapekey_names(obj: bpy.types.Object) -> tuple:
+    shapekeys = obj.data.shape_keys
+    if shapekeys is None or len(shapekeys.key_blocks) <= 1:
+        return ()
+    return tuple(key.name for key in shapekeys.key_blocks[1:])
+
+
+def get_mesh_shapekey_names(objects: list) -> tuple:
+    meshes = {obj.data.name_full: obj for obj in objects}
+    return tuple((name, get_object_shapekey_names(obj)) for name, obj in meshes.items())
+
+
+def get_collection_shapekeys(collection: bpy.types.Collection) -> list:
+    mesh_shapekey_names = get_mesh_shapekey_names(get_child_objects(collection))
+    total_shapekeys = chain.from_iterable(names for _, names in mesh_shapekey_names)
+    return list(dict.fromkeys(total_shapekeys))
+
+
+def update_collection_shepekey_settings(
+    collection_setting: bpy.types.AnyType,
+    *,
+    force: bool = False,
+) -> None:
+    collection = collection_setting.collection_ptr
+    if collection is None:
+        return
+
+    shapekey_settings = collection_setting.shapekey_settings
+    shapekeys = shapekey_settings.shapekeys
+
+    # Skip collections whose shapekey names are unchanged since the last sync
+    cache_key = (collection_setting.id_data.name_full, collection.name_full)
+    state = collection_shapekey_signatures.get(cache_key)
+    if (
+        not force
+        and state is not None
+        and state.settings_count == len(shapekeys)
+        and not get_changes(state.revision).affects(state.objects, state.shape_keys)
+    ):
+        return
+
+    revision = get_revision()
+    objects = get_child_objects(collection)
+    mesh_shapekey_names = get_mesh_shapekey_names(objects)
+    signature = hash(mesh_shapekey_names)
+    if (
+        not force
+        and state is not None
+        and (state.signature, state.settings_count) == (signature, len(shapekeys))
+    ):
+        state.revision = revision
+        return
+
+    shapekey_names = dict.fromkeys(
+        chain.from_iterable(names for _, names in mesh_shapekey_names),
+    )
+
+    # Add new shapekeys and configure them with the rules
+    current_names = {shapekey.name for shapekey in shapekeys}
+    new_names = [name for name in shapekey_names if name not in current_names]
+    rules = compile_shapekey_rules(shapekey_settings.rules) if new_names else []
+    for name in new_names:
+        shapekey_item = shapekeys.add()
+        shapekey_item.name = name
+        apply_shapekey_rules(shapekey_item, rules)
+
+    # Remove deleted shapekeys
+    remove_idx = [
+        i for i, shapekey in enumerate(shapekeys) if shapekey.name not in shapekey_names
+    ]
+    for i in reversed(remove_idx):
+        shapekeys.remove(i)
+
+    collection_shapekey_signatures[cache_key] = ShapekeySyncState(
+        signature=signature,
+        settings_count=len(shapekeys),
+        revision=revision,
+        objects={obj.name_full for obj in objects},
+        shape_keys={
+            obj.data.shape_keys.name_full
+            for obj in objects
+            if obj.data.shape_keys is not None
+        },
+    )
+
+
+def update_active_collection_shapekeys(
+    context: bpy.types.Context,
+    *,
+    force: bool = False,
+) -> None:
+    if context and context.scene.yfx_exporter_settings:
+        export_settings = context.scene.yfx_exporter_settings.export_settings
+        collection_settings = export_settings.collections
+        collection_index = export_settings.collection_index
+        len_collections = len(collection_settings)
+
+        if len_collections > 0 and 0 <= collection_index < len_collections:
+            collection_setting = collection_settings[collection_index]
+            update_collection_shepekey_settings(collection_setting, force=force)
+
+
+def update_all_collection_shapekeys(context: bpy.types.Context) -> None:
+    if context and context.scene.yfx_exporter_settings:
+        export_settings = context.scene.yfx_exporter_settings.export_settings
+        collection_settings = export_settings.collections
+        len_collections = len(collection_settings)
+
+        for i in range(len_collections):
+            collection_setting = collection_settings[i]
+            update_collection_shepekey_settings(collection_setting)
+
+
+def register() -> None:
+    # States of the previous file must not skip the sync of a file with the
+    # same scene and collection names
+    reset_callbacks.append(collection_shapekey_signatures.clear)
+
+
+def unregister() -> None:
+    if collection_shapekey_signatures.clear in reset_callbacks:
+        reset_callbacks.remove(collection_shapekey_signatures.clear)
+    collection_shapekey_signatures.clear()
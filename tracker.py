@@ -0,0 +1,148 @@
+"""
+Dirty tracking of data-blocks from depsgraph updates.
+
+Consumers are the shapekey settings sync, the UI list filters and the
+collection enum of the add collection operator. Two rescans are left out on
+purpose:
+- remove_invalid_collection_settings only checks the configured collection
+  settings. Pointers cleared in the UI are not depsgraph updates, and the
+  scan is cheaper than checking the changes.
+- validate reads geometry, bones, materials and add-on settings, which are
+  not all tracked. It runs once per export, where a stale result would be
+  worse than the rescan.
+"""
+
+from dataclasses import dataclass, field
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Revision counter incremented for every depsgraph update.
+# Consumers store the revision of their last sync and ask for the changes since then.
+revision = 0
+full_revision = 0
+tracking = False  # Handlers are not registered. (e.g. Export in background process)
+
+# key: name of changed data-block, value: revision of the last change
+object_revisions = {}
+collection_revisions = {}
+shape_key_revisions = {}
+
+# Functions called when everything is marked dirty.
+# Caches derived from the current file register their clear function here.
+reset_callbacks = []
+
+
+@dataclass
+class Changes:
+    objects: set = field(default_factory=set)
+    collections: set = field(default_factory=set)
+    shape_keys: set = field(default_factory=set)
+    full: bool = False  # Everything must be rescanned (file load, undo, ...)
+
+    def is_empty(self) -> bool:
+        return not (self.full or self.objects or self.collections or self.shape_keys)
+
+    def affects(self, objects: set, shape_keys: set) -> bool:
+        """
+        Check whether the changes may affect the given data-blocks.
+
+        Parameters:
+        - objects (set): Names of the objects the consumer depends on.
+        - shape_keys (set): Names of the shapekey data-blocks the consumer depends on.
+
+        Returns:
+        - bool: True if the consumer needs to be synchronized again.
+        """
+        return (
+            self.full
+            or len(self.collections) > 0
+            or not self.objects.isdisjoint(objects)
+            or not self.shape_keys.isdisjoint(shape_keys)
+        )
+
+
+def get_revision() -> int:
+    return revision
+
+
+def get_changes(since: int) -> Changes:
+    """Return the data-blocks changed after the given revision."""
+    if not tracking or full_revision > since:
+        return Changes(full=True)
+
+    return Changes(
+        objects={name for name, rev in object_revisions.items() if rev > since},
+        collections={name for name, rev in collection_revisions.items() if rev > since},
+        shape_keys={name for name, rev in shape_key_revisions.items() if rev > since},
+    )
+
+
+def mark_all_dirty() -> None:
+    global revision, full_revision  # noqa: PLW0603
+    revision += 1
+    full_revision = revision
+
+    object_revisions.clear()
+    collection_revisions.clear()
+    shape_key_revisions.clear()
+
+    for callback in reset_callbacks:
+        callback()
+
+
+@persistent
+def depsgraph_update_post_handler(
+    scene: bpy.types.Scene,
+    depsgraph: bpy.types.Depsgraph,
+) -> None:
+    global revision  # noqa: PLW0603
+    revision += 1
+
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object):
+            object_revisions[id_data.name_full] = revision
+            shapekeys = getattr(id_data.data, "shape_keys", None)
+            if shapekeys is not None:
+                shape_key_revisions[shapekeys.name_full] = revision
+        elif isinstance(id_data, bpy.types.Collection):
+            collection_revisions[id_data.name_full] = revision
+        elif isinstance(id_data, bpy.types.Mesh):
+            if id_data.shape_keys is not None:
+                shape_key_revisions[id_data.shape_keys.name_full] = revision
+        elif isinstance(id_data, bpy.types.Key):
+            shape_key_revisions[id_data.name_full] = revision
+
+
+@persistent
+def reset_handler(*_args: bpy.types.AnyType) -> None:
+    mark_all_dirty()
+
+
+reset_handlers = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+
+def register() -> None:
+    global tracking  # noqa: PLW0603
+    tracking = True
+
+    mark_all_dirty()
+    bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post_handler)
+    for handlers in reset_handlers:
+        handlers.append(reset_handler)
+
+
+def unregister() -> None:
+    global tracking  # noqa: PLW0603
+    tracking = False
+
+    for handlers in reset_handlers:
+        if reset_handler in handlers:
+            handlers.remove(reset_handler)
+    if depsgraph_update_post_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post_handler)
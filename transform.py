@@ -0,0 +1,98 @@
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+
+def get_corner_normals(mesh: bpy.types.Mesh) -> np.ndarray:
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):  # Blender 4.1+
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+
+def get_flipped_corner_order(mesh: bpy.types.Mesh) -> np.ndarray:
+    """
+    Return the old corner index of each corner after Mesh.flip_normals.
+
+    Flipping keeps the first corner of each face and reverses the others.
+    """
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int64)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    starts = np.repeat(loop_starts, loop_totals)
+    offsets = np.arange(len(mesh.loops)) - starts
+    return np.where(
+        offsets == 0,
+        starts,
+        starts + np.repeat(loop_totals, loop_totals) - offsets,
+    )
+
+
+def transform_mesh(mesh: bpy.types.Mesh, matrix: Matrix) -> None:
+    """
+    Transform vertices, all shapekeys and custom normals of the mesh in one batch.
+
+    Parameters:
+    - mesh (bpy.types.Mesh): The target mesh.
+    - matrix (Matrix): 4x4 transform matrix.
+    """
+    m = np.array(matrix, dtype=np.float32)
+    rotation_scale = m[:3, :3]
+    translation = m[:3, 3]
+
+    normals = get_corner_normals(mesh) if mesh.has_custom_normals else None
+
+    # Basis and all shapekeys are transformed as a single array
+    blocks = [mesh.vertices]
+    if mesh.shape_keys is not None:
+        blocks.extend(key.data for key in mesh.shape_keys.key_blocks)
+
+    co = np.empty((len(blocks), len(mesh.vertices) * 3), dtype=np.float32)
+    for block, block_co in zip(blocks, co, strict=True):
+        block.foreach_get("co", block_co)
+
+    co = co.reshape(-1, 3) @ rotation_scale.T + translation
+    co = co.reshape(len(blocks), -1)
+    for block, block_co in zip(blocks, co, strict=True):
+        block.foreach_set("co", block_co)
+
+    if np.linalg.det(rotation_scale) < 0:
+        # Keep faces pointing outwards after mirroring
+        if normals is not None:
+            # Custom normals follow the reversed corner order
+            normals = normals[get_flipped_corner_order(mesh)]
+        mesh.flip_normals()
+
+    if normals is not None:
+        # Normals are transformed by the inverse transpose matrix
+        normals = normals @ np.linalg.inv(rotation_scale)
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, lengths, out=normals, where=lengths > 0)
+        mesh.normals_split_custom_set(normals)
+
+    mesh.update()
+
+
+def apply_transform(obj: bpy.types.Object) -> None:
+    """
+    Apply location, rotation and scale of the object to its mesh data.
+
+    Parameters:
+    - obj (bpy.types.Object): The target mesh object.
+    """
+    matrix = obj.matrix_basis.copy()
+    if matrix == Matrix.Identity(4):
+        return
+
+    transform_mesh(obj.data, matrix)
+    obj.matrix_basis = Matrix.Identity(4)
+
+    # Keep children in place
+    for child in obj.children:
+        if child.parent_type == "OBJECT":
+            child.matrix_parent_inverse = matrix @ child.matrix_parent_inverse
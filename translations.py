@@ -78,7 +78,6 @@ translation_dict = {
             "*",
             "Deletes vertex groups not assigned to deform bones",
         ): "Deletes vertex groups not assigned to deform bones",
-        ("*", "FBX exported successfully!"): "FBX exported successfully!",
         (
             "*",
             "A validation check on the models in the scene, ensuring their exportability",
@@ -87,6 +86,197 @@ translation_dict = {
             "*",
             "[Validation Successful] All models in the scene have passed the exportability check successfully",
         ): "[Validation Successful] All models in the scene have passed the exportability check successfully",
+        ("*", "Regex"): "Regex",
+        (
+            "*",
+            "Filter names by regular expression instead of prefix",
+        ): "Filter names by regular expression instead of prefix",
+        ("*", "Shapekey Filter"): "Shapekey Filter",
+        ("*", "Show all shapekeys"): "Show all shapekeys",
+        ("*", "Show only shapekeys to be split"): "Show only shapekeys to be split",
+        ("*", "Show only shapekeys to be deleted"): "Show only shapekeys to be deleted",
+        ("*", "Pattern"): "Pattern",
+        (
+            "*",
+            "Shapekey name pattern. '*' matches any characters",
+        ): "Shapekey name pattern. '*' matches any characters",
+        (
+            "*",
+            "Name of the shapekey on the left. '*' is replaced with the characters matched by the pattern",
+        ): "Name of the shapekey on the left. '*' is replaced with the characters matched by the pattern",
+        (
+            "*",
+            "Name of the shapekey on the right. '*' is replaced with the characters matched by the pattern",
+        ): "Name of the shapekey on the right. '*' is replaced with the characters matched by the pattern",
+        ("*", "Shapekey Rules"): "Shapekey Rules",
+        ("*", "Add Shapekey Rule"): "Add Shapekey Rule",
+        (
+            "*",
+            "Add a rule to configure shapekeys matching the pattern",
+        ): "Add a rule to configure shapekeys matching the pattern",
+        ("*", "Remove Shapekey Rule"): "Remove Shapekey Rule",
+        ("*", "Remove the active shapekey rule"): "Remove the active shapekey rule",
+        ("*", "Apply Shapekey Rules"): "Apply Shapekey Rules",
+        (
+            "*",
+            "Configure all shapekeys in the collection with the rules",
+        ): "Configure all shapekeys in the collection with the rules",
+        ("*", "%d shapekeys configured"): "%d shapekeys configured",
+        ("*", "Limit to Merge Collections"): "Limit to Merge Collections",
+        (
+            "*",
+            "Only realize, localize and apply modifiers to objects in merge collections and the objects they depend on. Other objects are exported as they are",
+        ): "Only realize, localize and apply modifiers to objects in merge collections and the objects they depend on. Other objects are exported as they are",
+        ("*", "Cancel Export"): "Cancel Export",
+        (
+            "*",
+            "Cancel the running background export",
+        ): "Cancel the running background export",
+        ("*", "Export cancelled"): "Export cancelled",
+        (
+            "*",
+            "YFX Exporter: %s %d%% (ESC to cancel)",
+        ): "YFX Exporter: %s %d%% (ESC to cancel)",
+        ("*", "glTF settings"): "glTF settings",
+        ("*", "Export Formats"): "Export Formats",
+        (
+            "*",
+            "File formats written from the same preprocessed scene",
+        ): "File formats written from the same preprocessed scene",
+        ("*", "Export FBX to the export path"): "Export FBX to the export path",
+        (
+            "*",
+            "Export glTF Binary next to the export path",
+        ): "Export glTF Binary next to the export path",
+        ("*", "Quantize Position"): "Quantize Position",
+        ("*", "Tex Coord"): "Tex Coord",
+        ("*", "Generic"): "Generic",
+        ("*", "No export format is selected"): "No export format is selected",
+        ("*", "Split by Merge Collection"): "Split by Merge Collection",
+        (
+            "*",
+            "Write each merge collection and its armature to its own file named {export file name}_{collection name}",
+        ): "Write each merge collection and its armature to its own file named {export file name}_{collection name}",
+        ("*", "Ratio"): "Ratio",
+        (
+            "*",
+            "Ratio of faces to keep, relative to the merged mesh",
+        ): "Ratio of faces to keep, relative to the merged mesh",
+        ("*", "Generate LOD"): "Generate LOD",
+        (
+            "*",
+            "Generate decimated copies of the merged object named {name}_LOD{n}",
+        ): "Generate decimated copies of the merged object named {name}_LOD{n}",
+        ("*", "Preserve Shapekeys"): "Preserve Shapekeys",
+        (
+            "*",
+            "Transfer shapekeys of the merged object to each LOD",
+        ): "Transfer shapekeys of the merged object to each LOD",
+        ("*", "Preserve UV Seams"): "Preserve UV Seams",
+        (
+            "*",
+            "Prefer keeping vertices on UV seams and UV island boundaries. They can still be collapsed at low ratios",
+        ): "Prefer keeping vertices on UV seams and UV island boundaries. They can still be collapsed at low ratios",
+        ("*", "LOD Output"): "LOD Output",
+        ("*", "Same File"): "Same File",
+        (
+            "*",
+            "Write LOD objects into the same file",
+        ): "Write LOD objects into the same file",
+        ("*", "Separate Files"): "Separate Files",
+        (
+            "*",
+            "Write each LOD level to its own file named {export file name}_LOD{n}",
+        ): "Write each LOD level to its own file named {export file name}_LOD{n}",
+        ("*", "Add LOD Level"): "Add LOD Level",
+        (
+            "*",
+            "Add a LOD level with half the ratio of the last level",
+        ): "Add a LOD level with half the ratio of the last level",
+        ("*", "Remove LOD Level"): "Remove LOD Level",
+        ("*", "Remove the active LOD level"): "Remove the active LOD level",
+        ("*", "Compact Shapekeys"): "Compact Shapekeys",
+        (
+            "*",
+            "Snap small shapekey offsets to zero so that unchanged vertices are not written to the file",
+        ): "Snap small shapekey offsets to zero so that unchanged vertices are not written to the file",
+        ("*", "Threshold"): "Threshold",
+        (
+            "*",
+            "Offsets shorter than this distance are snapped to zero",
+        ): "Offsets shorter than this distance are snapped to zero",
+        ("*", "Quantize"): "Quantize",
+        ("*", "Round shapekey offsets to a grid"): "Round shapekey offsets to a grid",
+        ("*", "Grid Size"): "Grid Size",
+        ("*", "Grid size of quantized offsets"): "Grid size of quantized offsets",
+        ("*", "Weld Vertices"): "Weld Vertices",
+        (
+            "*",
+            "Merge vertices that coincide in the basis and all shapekeys after merging",
+        ): "Merge vertices that coincide in the basis and all shapekeys after merging",
+        ("*", "Merge Distance"): "Merge Distance",
+        (
+            "*",
+            "Merge vertices closer than this in the basis and all shapekeys",
+        ): "Merge vertices closer than this in the basis and all shapekeys",
+        ("*", "Boundary Only"): "Boundary Only",
+        (
+            "*",
+            "Only merge vertices on open boundaries, such as seams between merged parts",
+        ): "Only merge vertices on open boundaries, such as seams between merged parts",
+        ("*", "Merge Material Slots"): "Merge Material Slots",
+        (
+            "*",
+            "Merge slots with the same material and remove unused slots to reduce draw calls",
+        ): "Merge slots with the same material and remove unused slots to reduce draw calls",
+        ("*", "Group by Atlas"): "Group by Atlas",
+        (
+            "*",
+            "Merge slots of materials that have the same atlas key",
+        ): "Merge slots of materials that have the same atlas key",
+        ("*", "Atlas Key"): "Atlas Key",
+        (
+            "*",
+            "Custom property of materials that names their texture atlas",
+        ): "Custom property of materials that names their texture atlas",
+        ("*", "Limit Bone Influences"): "Limit Bone Influences",
+        (
+            "*",
+            "Keep only the largest deform weights of each vertex",
+        ): "Keep only the largest deform weights of each vertex",
+        ("*", "Max Influences"): "Max Influences",
+        (
+            "*",
+            "Maximum number of deform bones per vertex",
+        ): "Maximum number of deform bones per vertex",
+        ("*", "Normalize"): "Normalize",
+        (
+            "*",
+            "Scale deform weights of each vertex to sum to 1",
+        ): "Scale deform weights of each vertex to sum to 1",
+        ("*", "Quantize to 8 bits"): "Quantize to 8 bits",
+        (
+            "*",
+            "Round normalized weights to multiples of 1/255 keeping their sum at 1",
+        ): "Round normalized weights to multiples of 1/255 keeping their sum at 1",
+        ("*", "Memory Budget (GB)"): "Memory Budget (GB)",
+        (
+            "*",
+            "Memory the export may use in addition to the loaded scene. The export fails early if its estimate exceeds the budget. Unused data is freed between merge collections only in background exports, main process exports keep it. 0 means no limit",
+        ): "Memory the export may use in addition to the loaded scene. The export fails early if its estimate exceeds the budget. Unused data is freed between merge collections only in background exports, main process exports keep it. 0 means no limit",
+        (
+            "*",
+            "Estimated export memory %.1f GB exceeds the memory budget %.1f GB",
+        ): "Estimated export memory %.1f GB exceeds the memory budget %.1f GB",
+        (
+            "*",
+            ". With Split by Merge Collection it is %.1f GB",
+        ): ". With Split by Merge Collection it is %.1f GB",
+        ("*", "%s exported successfully!"): "%s exported successfully!",
+        (
+            "*",
+            "%s is unchanged. The existing files were kept",
+        ): "%s is unchanged. The existing files were kept",
     },
     "ja_JP": {
         (
@@ -159,7 +349,6 @@ translation_dict = {
             "*",
             "Deletes vertex groups not assigned to deform bones",
         ): "変形ボーンに割り当てられていない頂点グループを削除します",
-        ("*", "FBX exported successfully!"): "FBXのエクスポートに成功!",
         (
             "*",
             "A validation check on the models in the scene, ensuring their exportability",
@@ -168,6 +357,206 @@ translation_dict = {
             "*",
             "[Validation Successful] All models in the scene have passed the exportability check successfully",
         ): "[検証成功] シーン上のモデルがエクスポート可能であることをチェックしました",
+        ("*", "Regex"): "正規表現",
+        (
+            "*",
+            "Filter names by regular expression instead of prefix",
+        ): "前方一致の代わりに正規表現で名前を絞り込みます",
+        ("*", "Shapekey Filter"): "シェイプキーの絞り込み",
+        ("*", "Show all shapekeys"): "全てのシェイプキーを表示します",
+        ("*", "Show only shapekeys to be split"): "分割するシェイプキーのみ表示します",
+        (
+            "*",
+            "Show only shapekeys to be deleted",
+        ): "削除するシェイプキーのみ表示します",
+        ("*", "Pattern"): "パターン",
+        (
+            "*",
+            "Shapekey name pattern. '*' matches any characters",
+        ): "シェイプキー名のパターンです。'*'は任意の文字列に一致します",
+        (
+            "*",
+            "Name of the shapekey on the left. '*' is replaced with the characters matched by the pattern",
+        ): "左側に分割したシェイプキーの名前です。'*'はパターンに一致した文字列に置き換えられます",
+        (
+            "*",
+            "Name of the shapekey on the right. '*' is replaced with the characters matched by the pattern",
+        ): "右側に分割したシェイプキーの名前です。'*'はパターンに一致した文字列に置き換えられます",
+        ("*", "Shapekey Rules"): "シェイプキールール",
+        ("*", "Add Shapekey Rule"): "シェイプキールールを追加",
+        (
+            "*",
+            "Add a rule to configure shapekeys matching the pattern",
+        ): "パターンに一致するシェイプキーを設定するルールを追加します",
+        ("*", "Remove Shapekey Rule"): "シェイプキールールを削除",
+        (
+            "*",
+            "Remove the active shapekey rule",
+        ): "アクティブなシェイプキールールを削除します",
+        ("*", "Apply Shapekey Rules"): "シェイプキールールを適用",
+        (
+            "*",
+            "Configure all shapekeys in the collection with the rules",
+        ): "コレクション内の全てのシェイプキーをルールで設定します",
+        ("*", "%d shapekeys configured"): "%d個のシェイプキーを設定しました",
+        ("*", "Limit to Merge Collections"): "マージコレクションに限定",
+        (
+            "*",
+            "Only realize, localize and apply modifiers to objects in merge collections and the objects they depend on. Other objects are exported as they are",
+        ): "マージコレクション内のオブジェクトとその依存オブジェクトのみ、インスタンスの実体化、ローカル化、モディファイアの適用を行います。その他のオブジェクトはそのままエクスポートされます",
+        ("*", "Cancel Export"): "エクスポートをキャンセル",
+        (
+            "*",
+            "Cancel the running background export",
+        ): "実行中のバックグラウンドエクスポートをキャンセル",
+        ("*", "Export cancelled"): "エクスポートをキャンセルしました",
+        (
+            "*",
+            "YFX Exporter: %s %d%% (ESC to cancel)",
+        ): "YFX Exporter: %s %d%% (ESCでキャンセル)",
+        ("*", "glTF settings"): "glTF設定",
+        ("*", "Export Formats"): "エクスポート形式",
+        (
+            "*",
+            "File formats written from the same preprocessed scene",
+        ): "同じ前処理済みシーンから書き出すファイル形式",
+        ("*", "Export FBX to the export path"): "エクスポートパスにFBXをエクスポート",
+        (
+            "*",
+            "Export glTF Binary next to the export path",
+        ): "エクスポートパスと同じ場所にglTFバイナリをエクスポート",
+        ("*", "Quantize Position"): "位置の量子化",
+        ("*", "Tex Coord"): "テクスチャ座標",
+        ("*", "Generic"): "汎用",
+        ("*", "No export format is selected"): "エクスポート形式が選択されていません",
+        ("*", "Split by Merge Collection"): "マージコレクションごとに分割",
+        (
+            "*",
+            "Write each merge collection and its armature to its own file named {export file name}_{collection name}",
+        ): "マージコレクションごとにアーマチュアを含めて{エクスポートファイル名}_{コレクション名}の個別ファイルに書き出します",
+        ("*", "Ratio"): "比率",
+        (
+            "*",
+            "Ratio of faces to keep, relative to the merged mesh",
+        ): "マージされたメッシュに対して残す面の比率",
+        ("*", "Generate LOD"): "LODを生成",
+        (
+            "*",
+            "Generate decimated copies of the merged object named {name}_LOD{n}",
+        ): "マージされたオブジェクトをポリゴン削減したコピーを{name}_LOD{n}という名前で生成します",
+        ("*", "Preserve Shapekeys"): "シェイプキーを保持",
+        (
+            "*",
+            "Transfer shapekeys of the merged object to each LOD",
+        ): "マージされたオブジェクトのシェイプキーを各LODに転送します",
+        ("*", "Preserve UV Seams"): "UVシームを保持",
+        (
+            "*",
+            "Prefer keeping vertices on UV seams and UV island boundaries. They can still be collapsed at low ratios",
+        ): "UVシームとUVアイランド境界の頂点をできるだけ残します。低い比率では削減されることがあります",
+        ("*", "LOD Output"): "LODの出力",
+        ("*", "Same File"): "同じファイル",
+        (
+            "*",
+            "Write LOD objects into the same file",
+        ): "LODオブジェクトを同じファイルに書き出します",
+        ("*", "Separate Files"): "個別のファイル",
+        (
+            "*",
+            "Write each LOD level to its own file named {export file name}_LOD{n}",
+        ): "LODレベルごとに{エクスポートファイル名}_LOD{n}の個別ファイルに書き出します",
+        ("*", "Add LOD Level"): "LODレベルを追加",
+        (
+            "*",
+            "Add a LOD level with half the ratio of the last level",
+        ): "最後のレベルの半分の比率でLODレベルを追加します",
+        ("*", "Remove LOD Level"): "LODレベルを削除",
+        ("*", "Remove the active LOD level"): "アクティブなLODレベルを削除します",
+        ("*", "Compact Shapekeys"): "シェイプキーを圧縮",
+        (
+            "*",
+            "Snap small shapekey offsets to zero so that unchanged vertices are not written to the file",
+        ): "小さなシェイプキーの移動量を0にして、変化のない頂点をファイルに書き出さないようにします",
+        ("*", "Threshold"): "しきい値",
+        (
+            "*",
+            "Offsets shorter than this distance are snapped to zero",
+        ): "この距離より短い移動量は0になります",
+        ("*", "Quantize"): "量子化",
+        (
+            "*",
+            "Round shapekey offsets to a grid",
+        ): "シェイプキーの移動量をグリッドに丸めます",
+        ("*", "Grid Size"): "グリッドサイズ",
+        ("*", "Grid size of quantized offsets"): "量子化する移動量のグリッドサイズ",
+        ("*", "Weld Vertices"): "頂点を結合",
+        (
+            "*",
+            "Merge vertices that coincide in the basis and all shapekeys after merging",
+        ): "マージ後、ベースとすべてのシェイプキーで一致する頂点を結合します",
+        ("*", "Merge Distance"): "結合距離",
+        (
+            "*",
+            "Merge vertices closer than this in the basis and all shapekeys",
+        ): "ベースとすべてのシェイプキーでこの距離より近い頂点を結合します",
+        ("*", "Boundary Only"): "境界のみ",
+        (
+            "*",
+            "Only merge vertices on open boundaries, such as seams between merged parts",
+        ): "マージしたパーツ間の継ぎ目など、開いた境界上の頂点のみを結合します",
+        ("*", "Merge Material Slots"): "マテリアルスロットを統合",
+        (
+            "*",
+            "Merge slots with the same material and remove unused slots to reduce draw calls",
+        ): "同じマテリアルのスロットを統合し、未使用のスロットを削除してドローコールを削減します",
+        ("*", "Group by Atlas"): "アトラスでグループ化",
+        (
+            "*",
+            "Merge slots of materials that have the same atlas key",
+        ): "同じアトラスキーを持つマテリアルのスロットを統合します",
+        ("*", "Atlas Key"): "アトラスキー",
+        (
+            "*",
+            "Custom property of materials that names their texture atlas",
+        ): "テクスチャアトラスの名前を示すマテリアルのカスタムプロパティ",
+        ("*", "Limit Bone Influences"): "ボーン影響数を制限",
+        (
+            "*",
+            "Keep only the largest deform weights of each vertex",
+        ): "各頂点の大きい変形ウェイトのみを残します",
+        ("*", "Max Influences"): "最大影響数",
+        (
+            "*",
+            "Maximum number of deform bones per vertex",
+        ): "頂点あたりの変形ボーンの最大数",
+        ("*", "Normalize"): "正規化",
+        (
+            "*",
+            "Scale deform weights of each vertex to sum to 1",
+        ): "各頂点の変形ウェイトの合計が1になるように調整します",
+        ("*", "Quantize to 8 bits"): "8ビットに量子化",
+        (
+            "*",
+            "Round normalized weights to multiples of 1/255 keeping their sum at 1",
+        ): "正規化したウェイトを合計1のまま1/255の倍数に丸めます",
+        ("*", "Memory Budget (GB)"): "メモリ予算 (GB)",
+        (
+            "*",
+            "Memory the export may use in addition to the loaded scene. The export fails early if its estimate exceeds the budget. Unused data is freed between merge collections only in background exports, main process exports keep it. 0 means no limit",
+        ): "読み込まれたシーンに加えてエクスポートが使用できるメモリです。見積もりが予算を超える場合はエクスポートを開始前に中止します。未使用データはバックグラウンドエクスポートでのみマージコレクションごとに解放され、メインプロセスエクスポートでは保持されます。0は無制限です",
+        (
+            "*",
+            "Estimated export memory %.1f GB exceeds the memory budget %.1f GB",
+        ): "エクスポートの推定メモリ %.1f GB がメモリ予算 %.1f GB を超えています",
+        (
+            "*",
+            ". With Split by Merge Collection it is %.1f GB",
+        ): "。Split by Merge Collection を使用すると %.1f GB です",
+        ("*", "%s exported successfully!"): "%sのエクスポートに成功!",
+        (
+            "*",
+            "%s is unchanged. The existing files were kept",
+        ): "%sに変更がないため、既存のファイルを維持しました",
     },
 }
 
@@ -1,6 +1,12 @@
+import re
+from fnmatch import fnmatchcase
+
 import bpy
 import bpy_types
 
+from .jobs import has_running_jobs
+from .tracker import get_revision, reset_callbacks
+
 
 def show_popup_message(
     context: bpy_types.Context,
@@ -20,6 +26,128 @@ class View3dSidePanel:
     bl_category = "YFX"
 
 
+# Filter and sort results of UI lists
+# key: (list id, data pointer, propname), value: (signature, flags, order)
+ui_list_filter_cache = {}
+
+
+def match_item_names(names: list, pattern: str, *, use_regex: bool) -> list:
+    """
+    Match item names with the filter pattern.
+
+    Parameters:
+    - names (list): Item names.
+    - pattern (str): Prefix with wildcards, or regular expression if use_regex.
+    - use_regex (bool): Use the pattern as a regular expression.
+
+    Returns:
+    - list: Match result of each name.
+    """
+    if not pattern:
+        return [True] * len(names)
+
+    if use_regex:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            return [True] * len(names)
+        return [regex.search(name) is not None for name in names]
+
+    pattern = pattern.lower() + "*"
+    return [fnmatchcase(name.lower(), pattern) for name in names]
+
+
+class CachedFilterList:
+    """UIList mixin computing filter and sort results only when items change"""
+
+    use_filter_regex: bpy.props.BoolProperty(
+        name="Regex",
+        description="Filter names by regular expression instead of prefix",
+        default=False,
+    )
+
+    def get_item_name(self, item: bpy.types.AnyType) -> str:
+        return item.name
+
+    def get_item_state(self, item: bpy.types.AnyType) -> tuple:
+        return ()
+
+    def filter_item(self, state: tuple) -> bool:
+        return True
+
+    def get_filter_options(self) -> tuple:
+        return ()
+
+    def filter_items(
+        self,
+        context: bpy_types.Context,
+        data: bpy.types.AnyType,
+        propname: str,
+    ) -> tuple:
+        items = getattr(data, propname)
+
+        # Item names and states change only with a depsgraph update, which
+        # increments the revision. Items added by operators change the length
+        signature = (
+            get_revision(),
+            len(items),
+            self.filter_name,
+            self.use_filter_regex,
+            self.use_filter_sort_alpha,
+            self.get_filter_options(),
+        )
+        cache_key = (self.list_id, data.as_pointer(), propname)
+        cache = ui_list_filter_cache.get(cache_key)
+        if cache is not None and cache[0] == signature:
+            return cache[1], cache[2]
+
+        names = [self.get_item_name(item) for item in items]
+        states = [self.get_item_state(item) for item in items]
+
+        matches = match_item_names(
+            names,
+            self.filter_name,
+            use_regex=self.use_filter_regex,
+        )
+        flt_flags = [
+            self.bitflag_filter_item if match and self.filter_item(state) else 0
+            for match, state in zip(matches, states, strict=True)
+        ]
+
+        flt_neworder = []
+        if self.use_filter_sort_alpha:
+            flt_neworder = [0] * len(names)
+            sorted_indices = sorted(range(len(names)), key=lambda i: names[i].lower())
+            for new_index, index in enumerate(sorted_indices):
+                flt_neworder[index] = new_index
+
+        ui_list_filter_cache[cache_key] = (signature, flt_flags, flt_neworder)
+        return flt_flags, flt_neworder
+
+    def draw_filter_options(self, layout: bpy.types.UILayout) -> None:
+        pass
+
+    def draw_filter(
+        self,
+        context: bpy_types.Context,
+        layout: bpy.types.UILayout,
+    ) -> None:
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_regex", text="", icon="SORTBYEXT")
+        row.prop(self, "use_filter_invert", text="", icon="ARROW_LEFTRIGHT")
+
+        row = layout.row(align=True)
+        self.draw_filter_options(row)
+        row.prop(self, "use_filter_sort_alpha", text="", icon="SORTALPHA")
+        row.prop(
+            self,
+            "use_filter_sort_reverse",
+            text="",
+            icon="SORT_DESC" if self.use_filter_sort_reverse else "SORT_ASC",
+        )
+
+
 class YFX_EXPORTER_MT_collection_list_context(bpy.types.Menu):
     bl_label = "Collection list context menu"
 
@@ -29,7 +157,10 @@ class YFX_EXPORTER_MT_collection_list_context(bpy.types.Menu):
         layout.operator("yfx_exporter.clear_list", icon="X")
 
 
-class YFX_EXPORTER_UL_colllection(bpy.types.UIList):
+class YFX_EXPORTER_UL_colllection(CachedFilterList, bpy.types.UIList):
+    def get_item_name(self, item: bpy.types.AnyType) -> str:
+        return item.collection_ptr.name if item.collection_ptr else ""
+
     def draw_item(
         self,
         context: bpy_types.Context,
@@ -69,7 +200,10 @@ class YFX_EXPORTER_PT_export_panel(View3dSidePanel, bpy.types.Panel):
         col = row.column(align=True)
         row = col.row(align=True)
         row.scale_y = 1.5
-        row.operator("yfx_exporter.export_fbx", icon="CUBE")
+        if has_running_jobs():
+            row.operator("yfx_exporter.cancel_export", icon="CANCEL")
+        else:
+            row.operator("yfx_exporter.export_fbx", icon="CUBE")
 
         row = layout.row(align=True)
         if settings.export_path == "":
@@ -84,6 +218,9 @@ class YFX_EXPORTER_PT_export_panel(View3dSidePanel, bpy.types.Panel):
             icon="FILE_FOLDER",
         ).filepath = settings.export_path
 
+        row = layout.row(align=True)
+        row.prop(settings, "export_formats", expand=True)
+
         row = layout.row(align=True)
         row.operator("yfx_exporter.check_model", icon="ERROR")
 
@@ -269,11 +406,120 @@ class YFX_EXPORTER_PT_fbx_export_settings_custom(
         layout.use_property_split = True
         layout.use_property_decorate = False  # No animation.
 
+        layout.prop(export_settings, "limit_to_merge_collections")
+        layout.prop(export_settings, "split_by_collection")
+        layout.prop(export_settings, "lod_output")
+        layout.prop(export_settings, "memory_budget")
+
         row = layout.row()
         row.prop(export_settings, "use_main_process_export")
         row.label(text="", icon="ERROR")
 
 
+class YFX_EXPORTER_PT_gltf_export_settings_main_panel(
+    View3dSidePanel,
+    bpy.types.Panel,
+):
+    bl_label = "glTF settings"
+    bl_idname = "YFX_EXPORTER_PT_gltf_export_settings_main_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_export_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    @classmethod
+    def poll(cls, context: bpy_types.Context) -> bool:
+        export_settings = context.scene.yfx_exporter_settings.export_settings
+        return "GLTF" in export_settings.export_formats
+
+    def draw(self, context: bpy_types.Context) -> None:
+        scn = context.scene
+        settings = scn.yfx_exporter_settings
+        gltf_export_settings = settings.export_settings.gltf_export_settings
+
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False  # No animation.
+
+        layout.prop(gltf_export_settings, "export_yup")
+
+        layout.separator()
+        layout.prop(gltf_export_settings, "export_texcoords")
+        layout.prop(gltf_export_settings, "export_normals")
+        layout.prop(gltf_export_settings, "export_tangents")
+        layout.prop(gltf_export_settings, "export_materials")
+        layout.prop(gltf_export_settings, "export_image_format")
+
+        layout.separator()
+        layout.prop(gltf_export_settings, "export_morph")
+        row = layout.row()
+        row.enabled = gltf_export_settings.export_morph
+        row.prop(gltf_export_settings, "export_morph_normal")
+
+        layout.separator()
+        layout.prop(gltf_export_settings, "export_skins")
+        layout.prop(gltf_export_settings, "export_def_bones")
+        layout.prop(gltf_export_settings, "export_animations")
+
+
+class YFX_EXPORTER_PT_gltf_export_settings_compression_panel(
+    View3dSidePanel,
+    bpy.types.Panel,
+):
+    bl_label = "Compression"
+    bl_idname = "YFX_EXPORTER_PT_gltf_export_settings_compression_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_gltf_export_settings_main_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        scn = context.scene
+        settings = scn.yfx_exporter_settings
+        gltf_export_settings = settings.export_settings.gltf_export_settings
+
+        self.layout.prop(
+            gltf_export_settings,
+            "export_draco_mesh_compression_enable",
+            text="",
+        )
+
+    def draw(self, context: bpy_types.Context) -> None:
+        scn = context.scene
+        settings = scn.yfx_exporter_settings
+        gltf_export_settings = settings.export_settings.gltf_export_settings
+
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False  # No animation.
+
+        layout.enabled = gltf_export_settings.export_draco_mesh_compression_enable
+        layout.prop(gltf_export_settings, "export_draco_mesh_compression_level")
+
+        col = layout.column(align=True)
+        col.prop(
+            gltf_export_settings,
+            "export_draco_position_quantization",
+            text="Quantize Position",
+        )
+        col.prop(
+            gltf_export_settings,
+            "export_draco_normal_quantization",
+            text="Normal",
+        )
+        col.prop(
+            gltf_export_settings,
+            "export_draco_texcoord_quantization",
+            text="Tex Coord",
+        )
+        col.prop(
+            gltf_export_settings,
+            "export_draco_color_quantization",
+            text="Color",
+        )
+        col.prop(
+            gltf_export_settings,
+            "export_draco_generic_quantization",
+            text="Generic",
+        )
+
+
 class YFX_EXPORTER_PT_collection_panel(View3dSidePanel, bpy.types.Panel):
     bl_label = "Merge Collections"
     bl_idname = "YFX_EXPORTER_PT_collection_panel"
@@ -287,9 +533,8 @@ class YFX_EXPORTER_PT_collection_panel(View3dSidePanel, bpy.types.Panel):
         row = layout.row()
         col = row.column(align=True)
         row = col.row(align=True)
-        row.operator_menu_enum(
+        row.operator(
             "yfx_exporter.add_collection",
-            "user_collections",
             icon="ADD",
         )
 
@@ -352,7 +597,144 @@ class YFX_EXPORTER_PT_collection_setting_panel(View3dSidePanel, bpy.types.Panel)
             )
 
 
-class YFX_EXPORTER_UL_shapekey(bpy.types.UIList):
+class YFX_EXPORTER_PT_weld_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "Weld Vertices"
+    bl_idname = "YFX_EXPORTER_PT_weld_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_collection_setting_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        settings = context.scene.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            self.layout.prop(collection_setting.weld_settings, "weld_vertices", text="")
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            weld_settings = collection_setting.weld_settings
+
+            layout.use_property_split = True
+            layout.use_property_decorate = False  # No animation.
+            layout.enabled = weld_settings.weld_vertices
+
+            layout.prop(weld_settings, "merge_distance")
+            layout.prop(weld_settings, "boundary_only")
+
+
+class YFX_EXPORTER_PT_material_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "Merge Material Slots"
+    bl_idname = "YFX_EXPORTER_PT_material_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_collection_setting_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        settings = context.scene.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            self.layout.prop(
+                collection_setting.material_settings,
+                "merge_material_slots",
+                text="",
+            )
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            material_settings = collection_setting.material_settings
+
+            layout.use_property_split = True
+            layout.use_property_decorate = False  # No animation.
+            layout.enabled = material_settings.merge_material_slots
+
+            layout.prop(material_settings, "group_by_atlas")
+            row = layout.row()
+            row.enabled = material_settings.group_by_atlas
+            row.prop(material_settings, "atlas_key")
+
+
+class YFX_EXPORTER_PT_bone_influence_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "Limit Bone Influences"
+    bl_idname = "YFX_EXPORTER_PT_bone_influence_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_collection_setting_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        settings = context.scene.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            self.layout.prop(
+                collection_setting.vertex_group_settings,
+                "limit_influences",
+                text="",
+            )
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            vertex_group_settings = collection_setting.vertex_group_settings
+
+            layout.use_property_split = True
+            layout.use_property_decorate = False  # No animation.
+            layout.enabled = vertex_group_settings.limit_influences
+
+            layout.prop(vertex_group_settings, "max_influences")
+            layout.prop(vertex_group_settings, "normalize_weights")
+            row = layout.row()
+            row.enabled = vertex_group_settings.normalize_weights
+            row.prop(vertex_group_settings, "quantize_weights")
+
+
+class YFX_EXPORTER_UL_shapekey(CachedFilterList, bpy.types.UIList):
+    filter_shapekey_type: bpy.props.EnumProperty(
+        name="Shapekey Filter",
+        items=(
+            ("ALL", "All", "Show all shapekeys", "SHAPEKEY_DATA", 0),
+            ("SPLIT", "Split", "Show only shapekeys to be split", "MOD_MIRROR", 1),
+            ("DELETE", "Deleted", "Show only shapekeys to be deleted", "TRASH", 2),
+        ),
+        default="ALL",
+    )
+
+    def get_item_state(self, item: bpy.types.AnyType) -> tuple:
+        is_split = item.separate_shapekey and bool(
+            item.separate_shapekey_left or item.separate_shapekey_right,
+        )
+        is_deleted = item.separate_shapekey and item.delete_shapekey
+        return (is_split, is_deleted)
+
+    def filter_item(self, state: tuple) -> bool:
+        is_split, is_deleted = state
+        if self.filter_shapekey_type == "SPLIT":
+            return is_split
+        if self.filter_shapekey_type == "DELETE":
+            return is_deleted
+        return True
+
+    def get_filter_options(self) -> tuple:
+        return (self.filter_shapekey_type,)
+
+    def draw_filter_options(self, layout: bpy.types.UILayout) -> None:
+        layout.prop(self, "filter_shapekey_type", expand=True)
+
     def draw_item(
         self,
         context: bpy_types.Context,
@@ -462,3 +844,186 @@ class YFX_EXPORTER_PT_shapekey_settings_panel(View3dSidePanel, bpy.types.Panel):
                         shapekey_setting,
                         "delete_shapekey",
                     )
+
+
+class YFX_EXPORTER_UL_shapekey_rule(bpy.types.UIList):
+    def draw_item(
+        self,
+        context: bpy_types.Context,
+        layout: bpy.types.UILayout,
+        data: bpy.types.AnyType,
+        item: bpy.types.AnyType,
+        icon: int,
+        active_data: bpy.types.AnyType,
+        active_propname: str,
+        index: int,
+    ) -> None:
+        row = layout.row()
+        row.prop(item, "name", text="", emboss=False, icon="SORTBYEXT")
+        row.label(
+            text=f"{item.separate_shapekey_left} / {item.separate_shapekey_right}",
+            translate=False,
+        )
+
+    def invoke(self, context: bpy_types.Context, event: bpy.types.Event) -> None:
+        pass
+
+
+class YFX_EXPORTER_PT_shapekey_rule_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "Shapekey Rules"
+    bl_idname = "YFX_EXPORTER_PT_shapekey_rule_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_shapekey_settings_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            shapekey_settings = collection_setting.shapekey_settings
+
+            row = layout.row()
+            row.template_list(
+                "YFX_EXPORTER_UL_shapekey_rule",
+                "yfx_exporter_shapekey_rule_list_panel",
+                shapekey_settings,
+                "rules",
+                shapekey_settings,
+                "rule_index",
+                rows=3,
+            )
+
+            col = row.column(align=True)
+            col.operator("yfx_exporter.add_shapekey_rule", icon="ADD", text="")
+            col.operator("yfx_exporter.remove_shapekey_rule", icon="REMOVE", text="")
+
+            len_rules = len(shapekey_settings.rules)
+            if len_rules > 0 and 0 <= shapekey_settings.rule_index < len_rules:
+                rule = shapekey_settings.rules[shapekey_settings.rule_index]
+
+                col = layout.column(align=True)
+                col.use_property_split = True
+                col.use_property_decorate = False  # No animation.
+                col.prop(rule, "name")
+                col.prop(rule, "separate_shapekey_left")
+                col.prop(rule, "separate_shapekey_right")
+                col.prop(rule, "delete_shapekey")
+
+            row = layout.row(align=True)
+            row.operator("yfx_exporter.apply_shapekey_rules", icon="CHECKMARK")
+
+
+class YFX_EXPORTER_PT_shapekey_compaction_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "Compact Shapekeys"
+    bl_idname = "YFX_EXPORTER_PT_shapekey_compaction_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_shapekey_settings_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        settings = context.scene.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            self.layout.prop(
+                collection_setting.shapekey_settings,
+                "compact_shapekeys",
+                text="",
+            )
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            shapekey_settings = collection_setting.shapekey_settings
+
+            layout.use_property_split = True
+            layout.use_property_decorate = False  # No animation.
+            layout.enabled = shapekey_settings.compact_shapekeys
+
+            layout.prop(shapekey_settings, "delta_threshold")
+            layout.prop(shapekey_settings, "quantize_deltas")
+            row = layout.row()
+            row.enabled = shapekey_settings.quantize_deltas
+            row.prop(shapekey_settings, "quantize_step")
+
+
+class YFX_EXPORTER_UL_lod_level(bpy.types.UIList):
+    def draw_item(
+        self,
+        context: bpy_types.Context,
+        layout: bpy.types.UILayout,
+        data: bpy.types.AnyType,
+        item: bpy.types.AnyType,
+        icon: int,
+        active_data: bpy.types.AnyType,
+        active_propname: str,
+        index: int,
+    ) -> None:
+        row = layout.row()
+        row.label(text=f"LOD{index + 1}", translate=False, icon="MOD_DECIM")
+        row.prop(item, "ratio", text="", emboss=False)
+
+    def invoke(self, context: bpy_types.Context, event: bpy.types.Event) -> None:
+        pass
+
+
+class YFX_EXPORTER_PT_lod_panel(View3dSidePanel, bpy.types.Panel):
+    bl_label = "LOD"
+    bl_idname = "YFX_EXPORTER_PT_lod_panel"
+    bl_parent_id = "YFX_EXPORTER_PT_collection_setting_panel"
+    bl_options = {"DEFAULT_CLOSED"}  # noqa: RUF012
+
+    def draw_header(self, context: bpy_types.Context) -> None:
+        settings = context.scene.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            self.layout.prop(collection_setting.lod_settings, "generate_lod", text="")
+
+    def draw(self, context: bpy_types.Context) -> None:
+        layout = self.layout
+        scn = context.scene
+        settings = scn.yfx_exporter_settings.export_settings
+        len_collections = len(settings.collections)
+
+        if len_collections > 0 and 0 <= settings.collection_index < len_collections:
+            collection_setting = settings.collections[settings.collection_index]
+            lod_settings = collection_setting.lod_settings
+            layout.enabled = lod_settings.generate_lod
+
+            row = layout.row()
+            row.template_list(
+                "YFX_EXPORTER_UL_lod_level",
+                "yfx_exporter_lod_level_list_panel",
+                lod_settings,
+                "levels",
+                lod_settings,
+                "level_index",
+                rows=3,
+            )
+
+            col = row.column(align=True)
+            col.operator("yfx_exporter.add_lod_level", icon="ADD", text="")
+            col.operator("yfx_exporter.remove_lod_level", icon="REMOVE", text="")
+
+            col = layout.column(align=True)
+            col.prop(lod_settings, "preserve_shapekeys")
+            col.prop(lod_settings, "preserve_uv_seams")
+
+
+def register() -> None:
+    # Cached results refer to data of the previous file
+    reset_callbacks.append(ui_list_filter_cache.clear)
+
+
+def unregister() -> None:
+    if ui_list_filter_cache.clear in reset_callbacks:
+        reset_callbacks.remove(ui_list_filter_cache.clear)
+    ui_list_filter_cache.clear()
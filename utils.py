@@ -1,6 +1,6 @@
 import bpy
 
-from .shapekey import (
+from .shapekey_settings import (
     update_active_collection_shapekeys,
     update_all_collection_shapekeys,
 )
@@ -7,6 +7,9 @@ import bpy
 import bpy_types
 from bpy.app.translations import pgettext_tip as tip_
 
+from .armature import ArmatureCache
+from .memory import get_memory_budget_error
+
 
 class ErrorCategory(Enum):
     ERROR = "ERROR"
@@ -121,29 +124,50 @@ def check_armature_modifier_order(obj: bpy.types.Object) -> bool:
 
 
 # Function to check if the referenced Armature is hidden
-def check_hidden_armature(obj: bpy.types.Object) -> bool:
+def check_hidden_armature(
+    obj: bpy.types.Object,
+    armature_cache: ArmatureCache,
+) -> bool:
     # Find the Armature modifier
-    armature = obj.find_armature()
+    armature = armature_cache.get_armature(obj)
     if armature:
         return not (armature.visible_get())
 
     return False
 
 
-def check_inconsistent_armature(collection: bpy.types.Collection) -> bool:
-    return not (all_equal(obj.find_armature() for obj in get_child_objects(collection)))
+def check_inconsistent_armature(
+    collection: bpy.types.Collection,
+    armature_cache: ArmatureCache,
+) -> bool:
+    return not (
+        all_equal(
+            armature_cache.get_armature(obj) for obj in get_child_objects(collection)
+        )
+    )
 
 
 def check_geometry_node(obj: bpy.types.Object) -> bool:
     return any(modifier.type == "NODES" for modifier in obj.modifiers)
 
 
+def check_memory_budget(
+    scene: bpy.types.Scene,
+    export_settings: bpy.types.AnyType,
+) -> list:
+    memory_error = get_memory_budget_error(scene, export_settings)
+    if memory_error is None:
+        return []
+    return [ErrorInfo(code=19, category=ErrorCategory.ERROR, message=memory_error)]
+
+
 def validate(context: bpy_types.Context) -> list:
     error_list = []
 
     scn = context.scene
     export_settings = scn.yfx_exporter_settings.export_settings
     collection_settings = export_settings.collections
+    armature_cache = ArmatureCache()
 
     # Check file path error
     if check_fbx_path(export_settings.export_path):
@@ -154,6 +178,18 @@ def validate(context: bpy_types.Context) -> list:
         )
         error_list.append(err)
 
+    # Check export formats
+    if len(export_settings.export_formats) == 0:
+        err = ErrorInfo(
+            code=18,
+            category=ErrorCategory.ERROR,
+            message="No export format is selected",
+        )
+        error_list.append(err)
+
+    # Check memory budget
+    error_list.extend(check_memory_budget(scn, export_settings))
+
     # Check nestd collection
     nested_collections = check_nest_collections(collection_settings, scn.collection)
     if len(nested_collections) > 0:
@@ -172,7 +208,7 @@ def validate(context: bpy_types.Context) -> list:
     # Check Collections
     for c in collection_settings:
         collection = c.collection_ptr
-        if collection and check_inconsistent_armature(collection):
+        if collection and check_inconsistent_armature(collection, armature_cache):
             err = ErrorInfo(
                 code=7,
                 category=ErrorCategory.WARNING,
@@ -219,14 +255,14 @@ def validate(context: bpy_types.Context) -> list:
                 )
                 error_list.append(err)
 
-            if check_hidden_armature(obj):
+            if check_hidden_armature(obj, armature_cache):
                 err = ErrorInfo(
                     code=8,
                     category=ErrorCategory.WARNING,
                     message=tip_(
                         "Armature '%s' referenced by modifiers will not be exported as it's hidden",
                     )
-                    % obj.find_armature().name,
+                    % armature_cache.get_armature(obj).name,
                 )
                 error_list.append(err)
 
@@ -0,0 +1,190 @@
+"""
+Bone influence limiting of merged objects.
+
+Weights are read once into COO arrays (vertex, group, weight) and processed
+with NumPy over the full weight matrix. Only changed weights are written back,
+batched by group and weight value.
+"""
+
+import bpy
+import numpy as np
+
+from .armature import ArmatureCache
+from .protocol import check_cancelled, emit
+
+# 8-bit weights are stored as multiples of 1 / WEIGHT_LEVELS
+WEIGHT_LEVELS = 255
+
+
+def get_weight_entries(
+    mesh: bpy.types.Mesh,
+    group_indices: set,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read weights of the vertex groups as sparse COO arrays.
+
+    Returns:
+    - tuple[np.ndarray, np.ndarray, np.ndarray]: Vertex indices, group indices
+      and weights of every assigned weight.
+    """
+    entries = [
+        (vertex.index, element.group, element.weight)
+        for vertex in mesh.vertices
+        for element in vertex.groups
+        if element.group in group_indices
+    ]
+    if len(entries) == 0:
+        return (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.float64),
+        )
+    vertices, groups, weights = np.array(entries).T
+    return vertices.astype(np.int64), groups.astype(np.int64), weights
+
+
+def get_ranks(sorted_keys: np.ndarray) -> np.ndarray:
+    """Return the position of each entry within its run of equal keys."""
+    positions = np.arange(len(sorted_keys))
+    is_start = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+    return positions - np.maximum.accumulate(np.where(is_start, positions, 0))
+
+
+def limit_influences(
+    vertices: np.ndarray,
+    weights: np.ndarray,
+    max_influences: int,
+) -> np.ndarray:
+    """Return a mask of the largest weights of each vertex."""
+    order = np.lexsort((-weights, vertices))
+    keep = np.zeros(len(vertices), dtype=bool)
+    keep[order] = get_ranks(vertices[order]) < max_influences
+    return keep & (weights > 0)
+
+
+def normalize_weights(
+    vertices: np.ndarray,
+    weights: np.ndarray,
+    vertex_count: int,
+) -> np.ndarray:
+    sums = np.bincount(vertices, weights, minlength=vertex_count)[vertices]
+    return np.divide(weights, sums, out=np.zeros_like(weights), where=sums > 0)
+
+
+def quantize_weights(
+    vertices: np.ndarray,
+    weights: np.ndarray,
+    vertex_count: int,
+) -> np.ndarray:
+    """
+    Round normalized weights to 8 bits keeping the sum of each vertex at 1.
+
+    The units lost by flooring are given to the weights with the largest
+    remainders (largest remainder method).
+    """
+    scaled = weights * WEIGHT_LEVELS
+    floors = np.floor(scaled)
+
+    sums = np.bincount(vertices, weights, minlength=vertex_count)
+    floor_sums = np.bincount(vertices, floors, minlength=vertex_count)
+    shortages = np.where(sums > 0, np.rint(WEIGHT_LEVELS - floor_sums), 0)
+
+    order = np.lexsort((floors - scaled, vertices))
+    rounds_up = np.zeros(len(vertices), dtype=bool)
+    rounds_up[order] = get_ranks(vertices[order]) < shortages[vertices[order]]
+
+    return (floors + rounds_up) / WEIGHT_LEVELS
+
+
+def write_weights(
+    obj: bpy.types.Object,
+    entries: tuple[np.ndarray, np.ndarray, np.ndarray],
+    new_weights: np.ndarray,
+) -> None:
+    """
+    Write back the changed weights. Entries with zero weight are removed.
+
+    Parameters:
+    - obj (bpy.types.Object): The target object.
+    - entries (tuple[np.ndarray, np.ndarray, np.ndarray]): Original entries.
+    - new_weights (np.ndarray): New weight of each entry.
+    """
+    vertices, groups, weights = entries
+    new_weights = new_weights.astype(np.float32)
+    removed = new_weights <= 0
+    changed = ~removed & (new_weights != weights.astype(np.float32))
+
+    for group_index in np.unique(groups[removed]).tolist():
+        check_cancelled()
+        obj.vertex_groups[group_index].remove(
+            vertices[removed & (groups == group_index)].tolist(),
+        )
+
+    # One call per group and weight value. 8-bit weights have few values
+    runs = {}  # key: (group index, weight), value: vertex indices
+    for vertex, group_index, weight in zip(
+        vertices[changed].tolist(),
+        groups[changed].tolist(),
+        new_weights[changed].tolist(),
+        strict=True,
+    ):
+        runs.setdefault((group_index, weight), []).append(vertex)
+
+    for (group_index, weight), run_vertices in runs.items():
+        obj.vertex_groups[group_index].add(run_vertices, weight, "REPLACE")
+
+
+def limit_bone_influences(
+    obj: bpy.types.Object,
+    vertex_group_settings: bpy.types.AnyType,
+    armature_cache: ArmatureCache,
+) -> None:
+    """
+    Limit, normalize and quantize deform weights of the object.
+
+    Only vertex groups of deform bones are processed. Groups that become
+    empty are removed.
+
+    Parameters:
+    - obj (bpy.types.Object): The merged mesh object.
+    - vertex_group_settings (bpy.types.AnyType): Vertex group settings of the
+      merge collection.
+    - armature_cache (ArmatureCache): Armature lookups of the export.
+    """
+    group_indices = armature_cache.get_deform_group_indices(obj)
+    entries = get_weight_entries(obj.data, group_indices)
+    vertices, groups, weights = entries
+    if len(vertices) == 0:
+        return
+
+    vertex_count = len(obj.data.vertices)
+    keep = limit_influences(
+        vertices,
+        weights,
+        vertex_group_settings.max_influences,
+    )
+    new_weights = np.where(keep, weights, 0.0)
+    if vertex_group_settings.normalize_weights:
+        new_weights = normalize_weights(vertices, new_weights, vertex_count)
+        if vertex_group_settings.quantize_weights:
+            new_weights = quantize_weights(vertices, new_weights, vertex_count)
+
+    check_cancelled()
+    write_weights(obj, entries, new_weights)
+
+    # Remove groups that had weights and lost all of them
+    empty_groups = set(groups.tolist()) - set(groups[new_weights > 0].tolist())
+    empty_group_names = [obj.vertex_groups[i].name for i in empty_groups]
+    for name in empty_group_names:
+        obj.vertex_groups.remove(obj.vertex_groups[name])
+
+    influences = np.bincount(vertices, minlength=vertex_count)
+    emit(
+        "stats",
+        object=obj.name,
+        limited_vertices=int(
+            np.count_nonzero(influences > vertex_group_settings.max_influences),
+        ),
+        removed_weights=int(np.count_nonzero(new_weights <= 0)),
+        pruned_vertex_groups=len(empty_group_names),
+    )
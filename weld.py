@@ -0,0 +1,245 @@
+from collections.abc import Generator
+from itertools import product
+
+import bmesh
+import bpy
+import numpy as np
+from mathutils.kdtree import KDTree
+
+from .protocol import check_cancelled, emit
+from .shapekey import get_shapekey_co
+
+# Large primes spreading cell coordinates over the hash
+CELL_HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+NEIGHBOR_CELL_OFFSETS = np.array(list(product((-1, 0, 1), repeat=3)), dtype=np.int64)
+
+
+def get_boundary_vertices(mesh: bpy.types.Mesh) -> np.ndarray:
+    """Return indices of vertices on edges used by only one face."""
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    face_counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+
+    edge_vertices = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    return np.unique(edge_vertices.reshape(-1, 2)[face_counts == 1])
+
+
+def get_vertex_co(mesh: bpy.types.Mesh) -> np.ndarray:
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def hash_cells(cells: np.ndarray) -> np.ndarray:
+    # Collisions only add candidate pairs, which fail the distance check
+    return np.bitwise_xor.reduce(cells * CELL_HASH_PRIMES, axis=1)
+
+
+def iter_neighbor_candidates(
+    co: np.ndarray,
+    query_co: np.ndarray,
+    cell_size: float,
+) -> Generator[tuple[np.ndarray, np.ndarray], None, None]:
+    """
+    Yield candidate pairs of query points and points in neighboring cells.
+
+    Points are hashed into a grid of the cell size. Every point within the
+    cell size of a query point is in one of its 27 neighboring cells.
+
+    Parameters:
+    - co (np.ndarray): (N, 3) coordinates of the points.
+    - query_co (np.ndarray): (M, 3) coordinates of the query points.
+    - cell_size (float): Size of the grid cells.
+
+    Yields:
+    - tuple[np.ndarray, np.ndarray]: Query indices and point indices of the
+      candidates in one neighbor cell offset.
+    """
+    cell_keys = hash_cells(np.floor(co / cell_size).astype(np.int64))
+    order = np.argsort(cell_keys, kind="stable")
+    sorted_keys = cell_keys[order]
+    query_cells = np.floor(query_co / cell_size).astype(np.int64)
+
+    for offset in NEIGHBOR_CELL_OFFSETS:
+        neighbor_keys = hash_cells(query_cells + offset)
+        starts = np.searchsorted(sorted_keys, neighbor_keys, side="left")
+        counts = np.searchsorted(sorted_keys, neighbor_keys, side="right") - starts
+
+        # Expand each query point to all points of the neighbor cell
+        query_indices = np.repeat(np.arange(len(query_co)), counts)
+        run_offsets = np.arange(len(query_indices)) - np.repeat(
+            np.cumsum(counts) - counts,
+            counts,
+        )
+        yield query_indices, order[np.repeat(starts, counts) + run_offsets]
+
+
+def get_close_pairs(co: np.ndarray, distance: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find pairs of points closer than the distance.
+
+    Each point is compared with the points of its neighboring cells in a grid
+    of cell size distance.
+
+    Parameters:
+    - co (np.ndarray): (N, 3) coordinates.
+    - distance (float): Maximum distance.
+
+    Returns:
+    - tuple[np.ndarray, np.ndarray]: Indices of the pairs (first < second),
+      sorted by first and second.
+    """
+    pair_keys = []
+    for first, second in iter_neighbor_candidates(co, co, distance):
+        is_pair = first < second
+        pair_keys.append(first[is_pair] * len(co) + second[is_pair])
+
+    # Hash collisions can find the same pair through several offsets
+    pair_keys = np.unique(np.concatenate(pair_keys))
+    first, second = np.divmod(pair_keys, len(co))
+    return filter_close_pairs(co, first, second, distance)
+
+
+def filter_close_pairs(
+    co: np.ndarray,
+    first: np.ndarray,
+    second: np.ndarray,
+    distance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    is_close = np.sum((co[first] - co[second]) ** 2, axis=1) <= distance**2
+    return first[is_close], second[is_close]
+
+
+def get_nearest_points(
+    co: np.ndarray,
+    query_co: np.ndarray,
+    cell_size: float,
+) -> np.ndarray:
+    """
+    Find the nearest point of each query point.
+
+    Nearest points farther than the cell size may lie outside the searched
+    cells. Those query points are looked up in a KD tree.
+
+    Parameters:
+    - co (np.ndarray): (N, 3) coordinates of the points.
+    - query_co (np.ndarray): (M, 3) coordinates of the query points.
+    - cell_size (float): Size of the grid cells. About the point spacing.
+
+    Returns:
+    - np.ndarray: Index of the nearest point of each query point.
+    """
+    nearest = np.zeros(len(query_co), dtype=np.int64)
+    nearest_distances = np.full(len(query_co), np.inf)
+    for query_indices, indices in iter_neighbor_candidates(co, query_co, cell_size):
+        distances = np.sum((query_co[query_indices] - co[indices]) ** 2, axis=1)
+
+        # Closest candidate of each query point in this offset
+        order = np.lexsort((distances, query_indices))
+        sorted_queries = query_indices[order]
+        is_first = np.concatenate(([True], sorted_queries[1:] != sorted_queries[:-1]))
+        closest = order[is_first]
+
+        queries = query_indices[closest]
+        is_closer = distances[closest] < nearest_distances[queries]
+        nearest[queries[is_closer]] = indices[closest[is_closer]]
+        nearest_distances[queries[is_closer]] = distances[closest[is_closer]]
+
+    missed = np.flatnonzero(nearest_distances > cell_size**2)
+    if len(missed) > 0:
+        kd = KDTree(len(co))
+        for i, point in enumerate(co):
+            kd.insert(point, i)
+        kd.balance()
+        nearest[missed] = [kd.find(query_co[i])[1] for i in missed.tolist()]
+    return nearest
+
+
+def get_weld_targets(
+    obj: bpy.types.Object,
+    distance: float,
+    *,
+    boundary_only: bool,
+) -> dict:
+    """
+    Find vertices closer than the distance in the basis and in every shapekey.
+
+    Candidate pairs are found in the basis with a neighbor cell search. Each
+    shapekey then only checks the remaining pairs. Like Merge by Distance,
+    every vertex is welded to a lower index vertex within the distance, and
+    welds are not chained.
+
+    Parameters:
+    - obj (bpy.types.Object): The merged mesh object.
+    - distance (float): Merge distance.
+    - boundary_only (bool): Only weld vertices on open boundaries.
+
+    Returns:
+    - dict: key: vertex index, value: index of the vertex it is welded to.
+    """
+    mesh = obj.data
+    if boundary_only:
+        vertices = get_boundary_vertices(mesh)
+    else:
+        vertices = np.arange(len(mesh.vertices))
+    if len(vertices) < 2:  # noqa: PLR2004
+        return {}
+
+    if mesh.shape_keys is None:
+        first, second = get_close_pairs(get_vertex_co(mesh)[vertices], distance)
+    else:
+        key_blocks = mesh.shape_keys.key_blocks
+        first, second = get_close_pairs(
+            get_shapekey_co(key_blocks[0])[vertices],
+            distance,
+        )
+        for key in key_blocks[1:]:
+            if len(first) == 0:
+                return {}
+            check_cancelled()
+            co = get_shapekey_co(key)[vertices]
+            first, second = filter_close_pairs(co, first, second, distance)
+
+    targets = {}
+    for i, j in zip(vertices[first].tolist(), vertices[second].tolist(), strict=True):
+        # Welded vertices are neither welded again nor targets
+        if i not in targets and j not in targets:
+            targets[j] = i
+    return targets
+
+
+def weld_vertices(obj: bpy.types.Object, targets: dict) -> None:
+    """Weld vertices with BMesh. Shapekey layers are kept by the conversion."""
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        bmesh.ops.weld_verts(
+            bm,
+            targetmap={bm.verts[i]: bm.verts[j] for i, j in targets.items()},
+        )
+        bm.to_mesh(obj.data)
+    finally:
+        bm.free()
+    obj.data.update()
+
+
+def weld_seams(obj: bpy.types.Object, weld_settings: bpy.types.AnyType) -> int:
+    """
+    Weld coincident vertices at seams between the merged parts.
+
+    Returns:
+    - int: Number of removed vertices.
+    """
+    targets = get_weld_targets(
+        obj,
+        weld_settings.merge_distance,
+        boundary_only=weld_settings.boundary_only,
+    )
+    if len(targets) > 0:
+        weld_vertices(obj, targets)
+
+    emit("stats", object=obj.name, welded_vertices=len(targets))
+    return len(targets)